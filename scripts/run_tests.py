@@ -1,23 +1,105 @@
 """Script to run tests and manage test output."""
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 import re
 
+# pytest-xdist prefixes worker output with e.g. "[gw3] "
+_WORKER_PREFIX_RE = re.compile(r'^\[gw\d+\]\s*')
+
+_LOG_DIR = Path('logs')
+_log_dir_ready = False
+
+# Error section banners and coverage failures, matched in a single pass
+_BANNER_RE = re.compile(r'^(?P<banner>=+.*(?:ERROR|FAIL))|Coverage failure:')
+
+def build_pytest_command() -> list[str]:
+    """Build the pytest command line.
+    
+    Tests are distributed across workers with pytest-xdist. ``--dist=loadfile``
+    keeps all tests from one file on the same worker so module-level fixtures
+    are only set up once. The worker count can be overridden with the
+    ``CRS_PYTEST_WORKERS`` environment variable.
+    
+    Returns:
+        List of command line arguments
+    """
+    cmd = [
+        "pytest", "-v",
+        "-n", os.environ.get("CRS_PYTEST_WORKERS", "auto"),
+        "--dist=loadfile"
+    ]
+    # Skip writing .pytest_cache on CI where it is thrown away anyway
+    if os.environ.get("CI"):
+        cmd.extend(["-p", "no:cacheprovider"])
+    return cmd
+
+class ErrorExtractor:
+    """Incrementally extract error messages from pytest output.
+    
+    Lines are fed one at a time as pytest produces them, so the full
+    output never has to be held in memory.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize extractor state."""
+        self.in_error_block = False
+        self.error_lines: list[str] = []
+    
+    def feed(self, line: str) -> Optional[str]:
+        """Process a single line of pytest output.
+        
+        Args:
+            line: Output line, with or without trailing newline
+            
+        Returns:
+            The line if it belongs to an error message, None otherwise
+        """
+        line = _WORKER_PREFIX_RE.sub('', line.rstrip('\n'))
+        match = _BANNER_RE.search(line)
+        if match:
+            # Start of error section, or a coverage failure
+            if match.group('banner'):
+                self.in_error_block = True
+        # End of error section
+        elif line.startswith('=') and self.in_error_block:
+            self.in_error_block = False
+        # Lines outside error block
+        elif not self.in_error_block:
+            return None
+        
+        self.error_lines.append(line)
+        return line
+    
+    @property
+    def errors(self) -> str:
+        """String containing only the error messages seen so far."""
+        return '\n'.join(self.error_lines)
+
 def run_tests() -> tuple[str, int]:
-    """Run pytest and capture output.
+    """Run pytest, echoing output while extracting errors.
     
     Returns:
-        Tuple of (output string, return code)
+        Tuple of (error messages, return code)
     """
-    result = subprocess.run(
-        ["pytest", "-v"],
-        capture_output=True,
-        text=True
-    )
-    return result.stdout + result.stderr, result.returncode
+    extractor = ErrorExtractor()
+    with subprocess.Popen(
+        build_pytest_command(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1  # Line buffered
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            extractor.feed(line)
+        return_code = proc.wait()
+    
+    return extractor.errors, return_code
 
 def extract_errors(output: str) -> str:
     """Extract error messages from pytest output.
@@ -28,28 +110,10 @@ def extract_errors(output: str) -> str:
     Returns:
         String containing only error messages
     """
-    # Split output into lines
-    lines = output.split('\n')
-    error_lines = []
-    in_error_block = False
-    
-    for line in lines:
-        # Start of error section
-        if line.startswith('=') and 'ERROR' in line:
-            in_error_block = True
-            error_lines.append(line)
-        # End of error section
-        elif line.startswith('=') and in_error_block:
-            in_error_block = False
-            error_lines.append(line)
-        # Coverage failure
-        elif 'Coverage failure:' in line:
-            error_lines.append(line)
-        # Lines within error block
-        elif in_error_block:
-            error_lines.append(line)
-    
-    return '\n'.join(error_lines)
+    extractor = ErrorExtractor()
+    for line in output.split('\n'):
+        extractor.feed(line)
+    return extractor.errors
 
 def save_output(errors: str) -> None:
     """Save error output to log file.
@@ -57,33 +121,39 @@ def save_output(errors: str) -> None:
     Args:
         errors: Error messages to save
     """
-    log_dir = Path('logs')
-    log_dir.mkdir(exist_ok=True)
+    global _log_dir_ready
+    if not _log_dir_ready:
+        _LOG_DIR.mkdir(exist_ok=True)
+        _log_dir_ready = True
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file = log_dir / f'test_errors_{timestamp}.log'
+    log_file = _LOG_DIR / f'test_errors_{timestamp}.log'
     
     # Save latest errors
     log_file.write_text(errors)
     
-    # Create/update latest link
-    latest_link = log_dir / 'latest_errors.log'
-    if latest_link.exists():
-        latest_link.unlink()
-    latest_link.symlink_to(log_file.name)
+    # Atomically point the latest link at the new log
+    tmp_link = _LOG_DIR / 'latest_errors.log.tmp'
+    try:
+        tmp_link.unlink()
+    except FileNotFoundError:
+        pass
+    tmp_link.symlink_to(log_file.name)
+    os.replace(tmp_link, _LOG_DIR / 'latest_errors.log')
 
 def main() -> None:
     """Main entry point."""
     print("Running tests...")
-    output, return_code = run_tests()
+    errors, return_code = run_tests()
     
     if return_code != 0:
-        errors = extract_errors(output)
         save_output(errors)
-        print("\nErrors found! See logs/latest_errors.log for details.")
-        print("\nLatest errors:")
-        print("=" * 80)
-        print(errors)
+        sys.stdout.write(
+            "\nErrors found! See logs/latest_errors.log for details.\n"
+            "\nLatest errors:\n"
+            + "=" * 80 + "\n"
+            + errors + "\n"
+        )
     else:
         print("\nAll tests passed!")
     
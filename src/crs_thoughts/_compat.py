@@ -0,0 +1,26 @@
+"""Shims for optional dependencies shared across crs_thoughts."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to JSON bytes, using orjson if available.
+    
+    Args:
+        obj: Object to serialize
+        indent: Indent nested values by two spaces
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+# JSON parser accepting str or bytes, using orjson if available
+loads = orjson.loads if orjson is not None else json.loads
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""Invariant values shared by the Ollama helper scripts."""
+
+OLLAMA_BASE_URL = "http://localhost:11434"
+
+# Request paths, relative to OLLAMA_BASE_URL
+OLLAMA_VERSION_PATH = "/api/version"
+OLLAMA_TAGS_PATH = "/api/tags"
+OLLAMA_PULL_PATH = "/api/pull"
+
+OLLAMA_GENERATE_URL = OLLAMA_BASE_URL + "/api/generate"
+
+# Models the application expects Ollama to serve
+REQUIRED_MODELS = frozenset({
+    "llama3.2:latest",
+    "nomic-embed-text:v1.5",
+})
@@ -1,26 +1,85 @@
 """Base AI service functionality."""
 
+import asyncio
+import functools
 import os
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, FrozenSet, Optional
 import structlog
-import aiohttp
-import json
 import re
-import backoff
-from urllib.parse import urljoin
 
-from ..config.settings import ConfigManager
+if TYPE_CHECKING:
+    import aiohttp
+
+from .._compat import dumps, loads
+from ..config.settings import get_config
 from ..exceptions import AIError
+from ..utils.http import close_shared_session, get_session, import_aiohttp
 
 logger = structlog.get_logger(__name__)
 
+# Sampling options that are the same for every completion request
+_DEFAULT_OPTIONS = MappingProxyType({
+    "top_k": 40,
+    "top_p": 0.9,
+    "stop": []
+})
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# Seconds to wait before each retry of a failed completion request
+_RETRY_DELAYS = (0.5, 2.0)
+
+class _RequestStatusError(AIError):
+    """Raised when Ollama answers a request with a non-200 status."""
+    
+    def __init__(self, status: int):
+        super().__init__(f"AI request failed with status: {status}")
+        self.status = status
+    
+    @property
+    def retriable(self) -> bool:
+        """Whether the request may succeed if sent again unchanged."""
+        return not (400 <= self.status < 500 and self.status not in (408, 429))
+
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+@functools.lru_cache(maxsize=128)
+def _required_vars(template: str) -> FrozenSet[str]:
+    """Get the placeholder names used by a prompt template.
+    
+    Templates are module-level constants, so the scan is cached per template.
+    
+    Args:
+        template: Prompt template string
+        
+    Returns:
+        Set of placeholder names
+    """
+    return frozenset(match.group(1) for match in _PLACEHOLDER_RE.finditer(template))
+
+# Connection pool for Ollama; requests from all AI services share it
+_POOL = 'ollama'
+_POOL_LIMITS = MappingProxyType({
+    'limit': 32,
+    'limit_per_host': 16,
+    'keepalive_timeout': 60
+})
+
+async def _get_session() -> "aiohttp.ClientSession":
+    """Get the pooled client session for Ollama requests."""
+    return await get_session(_POOL, **_POOL_LIMITS)
+
 class AIService:
     """Base service for AI functionality."""
     
+    __slots__ = ('config', 'ai_config', 'session')
+    
     def __init__(self):
         """Initialize AI service with configuration."""
-        self.config = ConfigManager()
+        self.config = get_config()
         self.ai_config = self.config.settings.ai
+        # Borrowed from the shared pool while inside ``async with``
+        self.session: Optional["aiohttp.ClientSession"] = None
         
         if not self.ai_config.enabled:
             logger.warning("ai_service_disabled")
@@ -29,26 +88,20 @@ class AIService:
         if not self.ai_config.url:
             logger.error("ai_url_missing")
             raise AIError("AI service URL not configured")
-        
-        self.session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = await _get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
-            self.session = None
-
-    @backoff.on_exception(
-        backoff.expo,
-        (aiohttp.ClientError, AIError),
-        max_tries=3
-    )
+        """Async context manager exit.
+        
+        The shared session stays open for reuse by later services.
+        """
+        self.session = None
+
     async def generate_completion(
         self,
         prompt: str,
@@ -59,6 +112,9 @@ class AIService:
     ) -> str:
         """Generate completion from prompt using Ollama.
         
+        Failed requests are retried after the delays in ``_RETRY_DELAYS``,
+        except for client errors that would fail again unchanged.
+        
         Args:
             prompt: The prompt text
             temperature: Sampling temperature (0-1)
@@ -75,34 +131,58 @@ class AIService:
         if not self.ai_config.enabled:
             raise AIError("AI service is disabled")
             
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-            
-        try:
-            payload = {
-                "model": self.ai_config.model,
-                "prompt": prompt,
-                "system": system,
-                "template": template,
-                "stream": False,
-                "raw": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens,
-                    "top_k": 40,
-                    "top_p": 0.9,
-                    "stop": []
-                }
+        session = self.session or await _get_session()
+        payload = {
+            "model": self.ai_config.model,
+            "prompt": prompt,
+            "system": system,
+            "template": template,
+            "stream": False,
+            "raw": False,
+            "options": {
+                **_DEFAULT_OPTIONS,
+                "temperature": temperature,
+                "num_predict": max_tokens
             }
+        }
+        
+        for attempt, delay in enumerate((*_RETRY_DELAYS, None), start=1):
+            try:
+                return await self._post_completion(session, payload)
+            except AIError as e:
+                fatal = isinstance(e, _RequestStatusError) and not e.retriable
+                if delay is None or fatal:
+                    raise
+                logger.info("retrying_completion", attempt=attempt, error=str(e))
+                await asyncio.sleep(delay)
+
+    async def _post_completion(
+        self,
+        session: "aiohttp.ClientSession",
+        payload: dict
+    ) -> str:
+        """Send a single completion request to Ollama.
+        
+        Args:
+            session: Client session to send the request on
+            payload: Request payload
             
+        Returns:
+            Generated completion text
+            
+        Raises:
+            AIError: If the request fails
+        """
+        try:
             logger.debug("sending_ollama_request", 
-                        model=self.ai_config.model,
-                        temperature=temperature,
-                        max_tokens=max_tokens)
+                        model=payload["model"],
+                        temperature=payload["options"]["temperature"],
+                        max_tokens=payload["options"]["num_predict"])
             
-            async with self.session.post(
+            async with session.post(
                 f"{self.ai_config.url}/api/generate",
-                json=payload,
+                data=dumps(payload),
+                headers=_JSON_HEADERS,
                 timeout=30
             ) as response:
                 if response.status != 200:
@@ -110,9 +190,9 @@ class AIService:
                     logger.error("completion_request_failed",
                                status=response.status,
                                error=error_text)
-                    raise AIError(f"AI request failed with status: {response.status}")
+                    raise _RequestStatusError(response.status)
                 
-                data = await response.json()
+                data = await response.json(loads=loads)
                 if 'error' in data:
                     raise AIError(f"Ollama error: {data['error']}")
                     
@@ -125,7 +205,9 @@ class AIService:
                            eval_count=data.get('eval_count', 0))
                 return data['response']
                 
-        except aiohttp.ClientError as e:
+        except AIError:
+            raise
+        except import_aiohttp().ClientError as e:
             logger.error("completion_failed", error=str(e))
             raise AIError(f"Failed to generate completion: {str(e)}") from e
         except Exception as e:
@@ -148,21 +230,20 @@ class AIService:
         if not template:
             logger.error("empty_prompt_template")
             raise AIError("Empty prompt template")
+        
+        # Static prompts have nothing to substitute (or unescape)
+        if '{' not in template and '}' not in template:
+            return template
             
         try:
             # First validate that all required variables are present
-            required_vars = {
-                name.group(1)
-                for name in re.finditer(r'\{(\w+)\}', template)
-            }
-            
-            missing_vars = required_vars - set(kwargs.keys())
+            missing_vars = _required_vars(template) - kwargs.keys()
             if missing_vars:
                 missing_list = ', '.join(missing_vars)
                 logger.error("prompt_format_failed", missing_variables=missing_list)
                 raise AIError(f"Invalid prompt template: missing variable(s): {missing_list}")
                 
-            return template.format(**kwargs)
+            return template.format_map(kwargs)
         except KeyError as e:
             logger.error("prompt_format_failed", error=str(e))
             raise AIError(f"Invalid prompt template: missing variable {str(e)}") from e
@@ -172,20 +253,21 @@ class AIService:
 
     async def _verify_ollama(self) -> bool:
         """Verify Ollama is running and configured correctly."""
+        session = self.session or await _get_session()
         try:
-            async with self.session.get(f"{self.ai_config.url}/api/version") as response:
+            async with session.get(f"{self.ai_config.url}/api/version") as response:
                 if response.status != 200:
                     raise AIError("Ollama service is not healthy")
-                version_data = await response.json()
+                version_data = await response.json(loads=loads)
                 logger.info("ollama_running", version=version_data.get('version'))
                 
                 # Check for required models
-                async with self.session.get(f"{self.ai_config.url}/api/tags") as model_response:
+                async with session.get(f"{self.ai_config.url}/api/tags") as model_response:
                     if model_response.status != 200:
                         raise AIError("Failed to get model list")
                         
-                    data = await model_response.json()
-                    models = [model['name'] for model in data.get('models', [])]
+                    data = await model_response.json(loads=loads)
+                    models = {model['name'] for model in data.get('models', [])}
                     
                     required_models = [self.ai_config.model]  # Only check for main model
                     missing = [m for m in required_models if m not in models]
@@ -194,7 +276,7 @@ class AIService:
                         raise AIError(f"Missing required models: {', '.join(missing)}")
                         
                     return True
-        except aiohttp.ClientError as e:
+        except import_aiohttp().ClientError as e:
             raise AIError(f"Failed to connect to Ollama: {str(e)}") from e
         except Exception as e:
             raise AIError(f"Failed to verify Ollama: {str(e)}") from e
\ No newline at end of file
@@ -1,13 +1,14 @@
 """AI-powered thought enrichment functionality."""
 
 import asyncio
+import hashlib
+import itertools
 import uuid
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set, Union
 import click
 import structlog
-import re
 
-from .base import AIService
+from .base import AIService, close_shared_session
 from ..utils.storage import Storage
 from ..exceptions import AIError, ValidationError
 from ..search.searxng import SearchService, SearchError
@@ -24,10 +25,18 @@ Tags:"""
 class EnrichmentService(AIService):
     """Service for enriching thoughts with AI-generated metadata."""
     
-    def __init__(self):
-        """Initialize enrichment service."""
+    __slots__ = ('storage', 'use_cache', 'search', 'search_enabled')
+    
+    def __init__(self, use_cache: bool = True):
+        """Initialize enrichment service.
+        
+        Args:
+            use_cache: Whether to reuse tags previously generated for
+                identical content instead of querying the model again
+        """
         super().__init__()
         self.storage = Storage()
+        self.use_cache = use_cache
         try:
             self.search = SearchService()
             self.search_enabled = True
@@ -44,6 +53,18 @@ class EnrichmentService(AIService):
         Returns:
             Set of extracted tags
         """
+        # Tags depend on the model and prompt as well as the text itself
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.ai_config.model, TAG_EXTRACTION_PROMPT, content):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        cache_key = digest.hexdigest()
+        if self.use_cache:
+            cached = self.storage.get_cached_tags(cache_key)
+            if cached is not None:
+                logger.debug("tag_cache_hit", cache_key=cache_key)
+                return set(cached)
+        
         prompt = self.format_prompt(TAG_EXTRACTION_PROMPT, thought=content)
         response = await self.generate_completion(prompt)
         
@@ -54,6 +75,9 @@ class EnrichmentService(AIService):
             if len(tag.strip()) > 3
         }
         
+        if self.use_cache:
+            self.storage.cache_tags(cache_key, sorted(tags))
+        
         return tags
 
     def _generate_search_query(
@@ -72,31 +96,34 @@ class EnrichmentService(AIService):
         Returns:
             Optimized search query
         """
-        # Use first sentence of content
-        first_sentence = re.split(r'[.!?]', content)[0].strip()
+        # Use first sentence of content, scanning no further than needed
+        end = min(
+            (i for i in (content.find(c, 0, max_length) for c in '.!?') if i != -1),
+            default=min(len(content), max_length)
+        )
+        first_sentence = content[:end].strip()
         
         # Combine with most relevant tags
-        tag_string = ' '.join(list(tags)[:3])
+        tag_string = ' '.join(itertools.islice(tags, 3))
         
         query = f"{first_sentence} {tag_string}"
         return query[:max_length]
 
-    async def enrich_thought(
+    async def _build_enrichment(
         self,
         thought_uuid: uuid.UUID,
-        include_search: bool = True
+        search_service: Optional[SearchService] = None
     ) -> Dict[str, Any]:
-        """Enrich a thought with AI-generated metadata and relevant search results.
+        """Generate enrichment data for a thought without persisting it.
         
         Args:
             thought_uuid: UUID of the thought to enrich
-            include_search: Whether to include search results
+            search_service: Open search service, or None to skip search
             
         Returns:
             Dictionary containing enrichment data
             
         Raises:
-            AIError: If enrichment fails
             ValidationError: If thought not found
         """
         thought = self.storage.get_thought(thought_uuid)
@@ -107,57 +134,170 @@ class EnrichmentService(AIService):
                    thought_uuid=str(thought_uuid),
                    content_length=len(thought.content))
         
-        try:
-            # Extract tags using AI
-            tags = await self._extract_tags(thought.content)
+        # Extract tags using AI
+        tags = await self._extract_tags(thought.content)
+        
+        enrichment = {
+            'generated_tags': list(tags),
+            'search_results': []
+        }
+        
+        # Get related search results if enabled
+        if search_service is not None:
+            search_query = self._generate_search_query(
+                thought.content,
+                tags
+            )
+            try:
+                enrichment['search_results'] = await search_service.search(
+                    search_query,
+                    num_results=3
+                )
+            except SearchError as e:
+                logger.warning("search_failed", error=str(e))
+        
+        return enrichment
+
+    async def enrich_thought(
+        self,
+        thought_uuid: uuid.UUID,
+        include_search: bool = True
+    ) -> Dict[str, Any]:
+        """Enrich a thought with AI-generated metadata and relevant search results.
+        
+        Args:
+            thought_uuid: UUID of the thought to enrich
+            include_search: Whether to include search results
             
-            enrichment = {
-                'generated_tags': list(tags),
-                'search_results': []
-            }
+        Returns:
+            Dictionary containing enrichment data
             
-            # Get related search results if enabled
-            if include_search and self.search_enabled:
-                search_query = self._generate_search_query(
-                    thought.content,
-                    tags
-                )
-                try:
-                    async with self.search as search_service:
-                        enrichment['search_results'] = await search_service.search(
-                            search_query,
-                            num_results=3
-                        )
-                except SearchError as e:
-                    logger.warning("search_failed", error=str(e))
+        Raises:
+            AIError: If enrichment fails
+            ValidationError: If thought not found
+        """
+        results = await self.enrich_thoughts_batch(
+            [thought_uuid],
+            include_search=include_search,
+            concurrency=1
+        )
+        result = results[thought_uuid]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def enrich_thoughts_batch(
+        self,
+        thought_uuids: List[uuid.UUID],
+        include_search: bool = True,
+        concurrency: int = 8
+    ) -> Dict[uuid.UUID, Union[Dict[str, Any], Exception]]:
+        """Enrich several thoughts concurrently.
+        
+        Completions are issued in parallel over the shared session, at most
+        ``concurrency`` at a time. A thought that fails does not stop the
+        others; tags generated for every successful thought are written
+        back in a single storage update once all have been processed.
+        
+        Args:
+            thought_uuids: UUIDs of the thoughts to enrich
+            include_search: Whether to include search results
+            concurrency: Maximum number of thoughts enriched at once
             
-            # Update thought with generated tags
-            self.storage.update_thought_tags(
-                thought_uuid,
-                enrichment['generated_tags']
-            )
+        Returns:
+            Dictionary mapping thought UUID to its enrichment data, or to
+            the error it failed with: ValidationError if the thought was
+            not found, AIError otherwise
             
+        Raises:
+            AIError: If the generated tags cannot be saved
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _enrich_one(
+            thought_uuid: uuid.UUID,
+            search_service: Optional[SearchService]
+        ) -> Union[Dict[str, Any], Exception]:
+            try:
+                async with semaphore:
+                    return await self._build_enrichment(thought_uuid, search_service)
+            except ValidationError as e:
+                return e
+            except Exception as e:
+                logger.error("thought_enrichment_failed",
+                            thought_uuid=str(thought_uuid),
+                            error=str(e))
+                error = AIError(f"Failed to enrich thought: {str(e)}")
+                error.__cause__ = e
+                return error
+        
+        try:
+            if include_search and self.search_enabled:
+                async with self.search as search_service:
+                    enrichments = await asyncio.gather(
+                        *(_enrich_one(u, search_service) for u in thought_uuids)
+                    )
+            else:
+                enrichments = await asyncio.gather(
+                    *(_enrich_one(u, None) for u in thought_uuids)
+                )
+        except Exception as e:
+            logger.error("thought_enrichment_failed", error=str(e))
+            raise AIError(f"Failed to enrich thought: {str(e)}") from e
+        
+        results = dict(zip(thought_uuids, enrichments))
+        succeeded = {
+            thought_uuid: enrichment
+            for thought_uuid, enrichment in results.items()
+            if not isinstance(enrichment, Exception)
+        }
+        
+        # Update thoughts with generated tags
+        if succeeded:
+            try:
+                self.storage.update_thought_tags_bulk({
+                    thought_uuid: enrichment['generated_tags']
+                    for thought_uuid, enrichment in succeeded.items()
+                })
+            except Exception as e:
+                logger.error("thought_enrichment_failed", error=str(e))
+                raise AIError(f"Failed to enrich thought: {str(e)}") from e
+        
+        for thought_uuid, enrichment in succeeded.items():
             logger.info("thought_enriched_successfully",
                        thought_uuid=str(thought_uuid),
                        num_tags=len(enrichment['generated_tags']),
                        num_search_results=len(enrichment['search_results']))
-            
-            return enrichment
-        except Exception as e:
-            logger.error("thought_enrichment_failed", error=str(e))
-            raise AIError(f"Failed to enrich thought: {str(e)}") from e
+        
+        return results
+
+async def _enrich_thought(
+    thought_uuid: uuid.UUID,
+    include_search: bool,
+    use_cache: bool
+) -> Dict[str, Any]:
+    """Enrich a thought using the shared session for the whole run."""
+    try:
+        async with EnrichmentService(use_cache=use_cache) as service:
+            return await service.enrich_thought(
+                thought_uuid,
+                include_search=include_search
+            )
+    finally:
+        await close_shared_session()
 
 @click.command()
 @click.option('--thought-uuid', required=True, help='UUID of the thought')
 @click.option('--no-search', is_flag=True, help='Disable search results')
-async def enrich_thought_main(thought_uuid: str, no_search: bool) -> None:
+@click.option('--no-cache', is_flag=True, help='Bypass the generated tag cache')
+def enrich_thought_main(thought_uuid: str, no_search: bool, no_cache: bool) -> None:
     """CLI command for enriching a thought."""
     try:
-        service = EnrichmentService()
-        enrichment = await service.enrich_thought(
+        enrichment = asyncio.run(_enrich_thought(
             uuid.UUID(thought_uuid),
-            include_search=not no_search
-        )
+            include_search=not no_search,
+            use_cache=not no_cache
+        ))
         
         click.echo("\nGenerated Tags:")
         click.echo(", ".join(enrichment['generated_tags']))
@@ -173,4 +313,4 @@ async def enrich_thought_main(thought_uuid: str, no_search: bool) -> None:
         exit(1)
 
 if __name__ == '__main__':
-    asyncio.run(enrich_thought_main()) 
\ No newline at end of file
+    enrich_thought_main()
\ No newline at end of file
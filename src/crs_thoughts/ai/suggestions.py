@@ -1,11 +1,12 @@
 """AI-powered suggestion functionality."""
 
+import asyncio
 import uuid
 from typing import List, Optional
 import click
 import structlog
 
-from .base import AIService
+from .base import AIService, close_shared_session
 from ..utils.storage import Storage
 from ..exceptions import AIError, ValidationError
 
@@ -38,6 +39,8 @@ Questions:
 class SuggestionService(AIService):
     """Service for generating AI-powered suggestions."""
     
+    __slots__ = ('storage',)
+    
     def __init__(self):
         """Initialize suggestion service."""
         super().__init__()
@@ -87,13 +90,28 @@ class SuggestionService(AIService):
         response = await self.generate_completion(prompt, temperature=0.8)
         return [q.strip() for q in response.split('\n') if q.strip()]
 
+async def _suggest_answer(question_uuid: uuid.UUID) -> str:
+    """Suggest an answer using the shared session for the whole run."""
+    try:
+        async with SuggestionService() as service:
+            return await service.suggest_answer(question_uuid)
+    finally:
+        await close_shared_session()
+
+async def _suggest_questions(content: str) -> List[str]:
+    """Suggest questions using the shared session for the whole run."""
+    try:
+        async with SuggestionService() as service:
+            return await service.suggest_questions(content)
+    finally:
+        await close_shared_session()
+
 @click.command()
 @click.option('--question-uuid', required=True, help='UUID of the question')
 def suggest_answer_main(question_uuid: str) -> None:
     """CLI command for suggesting an answer."""
     try:
-        service = SuggestionService()
-        suggestion = service.suggest_answer(uuid.UUID(question_uuid))
+        suggestion = asyncio.run(_suggest_answer(uuid.UUID(question_uuid)))
         click.echo(suggestion)
     except Exception as e:
         logger.error("suggest_answer_failed", error=str(e))
@@ -105,8 +123,7 @@ def suggest_answer_main(question_uuid: str) -> None:
 def suggest_questions_main(content: str) -> None:
     """CLI command for suggesting related questions."""
     try:
-        service = SuggestionService()
-        suggestions = service.suggest_questions(content)
+        suggestions = asyncio.run(_suggest_questions(content))
         for question in suggestions:
             click.echo(question)
     except Exception as e:
@@ -5,19 +5,21 @@ Each command handles user input, validates it, and stores the entry in the appro
 """
 
 import argparse
+import functools
+import importlib
 import logging
 import os
 import sys
 from datetime import datetime
 import uuid
-from typing import Optional, NoReturn
+from typing import List, Optional, NoReturn
 from pathlib import Path
 
-from .commands import question, answer, thought
 from .utils.storage import Storage
 from .utils.formatting import escape_content, validate_uuid
 from .exceptions import ValidationError, StorageError
 from .utils.backup import BackupService
+from .utils.log import configure_structlog
 
 # Configure logging
 logging.basicConfig(
@@ -50,105 +52,111 @@ def handle_error(error: Exception, exit_code: int = 1) -> NoReturn:
     print(f"Error: {str(error)}", file=sys.stderr)
     sys.exit(exit_code)
 
-def question_main() -> None:
-    """Entry point for the question command.
+# Entry kinds recorded by the CLI, with the article used in help text
+_ENTRY_KINDS = {
+    'question': 'a',
+    'answer': 'an',
+    'thought': 'a',
+}
+
+@functools.lru_cache(maxsize=None)
+def _get_parser(kind: str) -> argparse.ArgumentParser:
+    """Build the argument parser for an entry command.
     
-    Records a new question with timestamp, username, and UUID.
+    Args:
+        kind: Entry kind ('question', 'answer' or 'thought')
     
-    Raises:
-        ValidationError: If the input content is invalid
-        StorageError: If there's an error storing the question
+    Returns:
+        argparse.ArgumentParser: Parser for the command
     """
-    parser = argparse.ArgumentParser(description='Record a question')
-    parser.add_argument('content', help='The question text')
-    args = parser.parse_args()
+    parser = argparse.ArgumentParser(description=f'Record {_ENTRY_KINDS[kind]} {kind}')
+    parser.add_argument('content', help=f'The {kind} text')
+    if kind == 'answer':
+        parser.add_argument('-q', '--question-uuid', help='UUID of the question being answered')
+    return parser
 
+def _record_entry(kind: str, argv: Optional[List[str]] = None) -> None:
+    """Parse arguments and record an entry of the given kind.
+    
+    Only the command module for ``kind`` is imported, so each entry point
+    avoids loading the handlers it does not use.
+    
+    Args:
+        kind: Entry kind ('question', 'answer' or 'thought')
+        argv: Command line arguments (defaults to sys.argv[1:])
+    
+    Raises:
+        SystemExit: If validation or storage fails
+    """
+    configure_structlog()
+    args = _get_parser(kind).parse_args(argv)
+    
+    extra = {}
+    if kind == 'answer':
+        if args.question_uuid and not validate_uuid(args.question_uuid):
+            logger.error("Invalid question UUID format")
+            handle_error(ValidationError("Invalid question UUID format"))
+        extra['question_uuid'] = args.question_uuid
+    
+    handler = getattr(
+        importlib.import_module(f'.commands.{kind}', __package__),
+        f'handle_{kind}'
+    )
+    
     storage = Storage()
     username = get_current_username()
     timestamp = datetime.now()
     entry_uuid = uuid.uuid4()
-
+    entry_id = str(entry_uuid)
+    label = kind.capitalize()
+    
     try:
-        logger.info(f"Recording question from user {username}")
-        question.handle_question(
+        logger.info("Recording %s from user %s", kind, username)
+        handler(
             storage=storage,
             content=escape_content(args.content),
             username=username,
             timestamp=timestamp,
-            entry_uuid=entry_uuid
+            entry_uuid=entry_uuid,
+            **extra
         )
-        logger.info(f"Question recorded successfully with UUID: {entry_uuid}")
-        print(f"Question recorded with UUID: {entry_uuid}")
+        logger.info("%s recorded successfully with UUID: %s", label, entry_id)
+        print(f"{label} recorded with UUID: {entry_id}")
     except (ValidationError, StorageError) as e:
         handle_error(e)
     except Exception as e:
         logger.error("Unexpected error occurred", exc_info=True)
         handle_error(e)
+    finally:
+        storage.close()
 
-def answer_main() -> None:
-    """Entry point for the answer command."""
-    parser = argparse.ArgumentParser(description='Record an answer')
-    parser.add_argument('content', help='The answer text')
-    parser.add_argument('-q', '--question-uuid', help='UUID of the question being answered')
-    args = parser.parse_args()
-
-    if args.question_uuid and not validate_uuid(args.question_uuid):
-        logger.error("Invalid question UUID format")
-        handle_error(ValidationError("Invalid question UUID format"))
 
-    storage = Storage()
-    username = get_current_username()
-    timestamp = datetime.now()
-    entry_uuid = uuid.uuid4()
+def question_main() -> None:
+    """Entry point for the question command.
+    
+    Records a new question with timestamp, username, and UUID.
+    
+    Raises:
+        ValidationError: If the input content is invalid
+        StorageError: If there's an error storing the question
+    """
+    _record_entry('question')
 
-    try:
-        logger.info(f"Recording answer from user {username}")
-        answer.handle_answer(
-            storage=storage,
-            content=escape_content(args.content),
-            username=username,
-            timestamp=timestamp,
-            entry_uuid=entry_uuid,
-            question_uuid=args.question_uuid
-        )
-        logger.info(f"Answer recorded successfully with UUID: {entry_uuid}")
-        print(f"Answer recorded with UUID: {entry_uuid}")
-    except (ValidationError, StorageError) as e:
-        handle_error(e)
-    except Exception as e:
-        logger.error("Unexpected error occurred", exc_info=True)
-        handle_error(e)
+def answer_main() -> None:
+    """Entry point for the answer command."""
+    _record_entry('answer')
 
 def thought_main() -> None:
     """Entry point for the thought command."""
-    parser = argparse.ArgumentParser(description='Record a thought')
-    parser.add_argument('content', help='The thought text')
-    args = parser.parse_args()
-
-    storage = Storage()
-    username = get_current_username()
-    timestamp = datetime.now()
-    entry_uuid = uuid.uuid4()
+    _record_entry('thought')
 
-    try:
-        logger.info(f"Recording thought from user {username}")
-        thought.handle_thought(
-            storage=storage,
-            content=escape_content(args.content),
-            username=username,
-            timestamp=timestamp,
-            entry_uuid=entry_uuid
-        )
-        logger.info(f"Thought recorded successfully with UUID: {entry_uuid}")
-        print(f"Thought recorded with UUID: {entry_uuid}")
-    except (ValidationError, StorageError) as e:
-        handle_error(e)
-    except Exception as e:
-        logger.error("Unexpected error occurred", exc_info=True)
-        handle_error(e)
-
-def backup_main() -> None:
-    """Entry point for the crsbackup command."""
+def backup_main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for the crsbackup command.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    configure_structlog()
     parser = argparse.ArgumentParser(
         description='Manage crs_thoughts backups',
         prog='crsbackup'
@@ -166,7 +174,7 @@ def backup_main() -> None:
     restore_parser = subparsers.add_parser('restore', help='Restore from backup')
     restore_parser.add_argument('backup_name', help='Name or path of backup to restore')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
         backup_service = BackupService()
@@ -181,13 +189,16 @@ def backup_main() -> None:
                 print("No backups found")
                 return
                 
-            print("\nAvailable backups:")
+            lines = ["\nAvailable backups:"]
             for backup in backups:
                 size_mb = backup['size'] / (1024 * 1024)
-                print(f"\nName: {backup['name']}")
-                print(f"Created: {backup['timestamp']}")
-                print(f"Version: {backup['version']}")
-                print(f"Size: {size_mb:.2f} MB")
+                lines.extend([
+                    f"\nName: {backup['name']}",
+                    f"Created: {backup['timestamp']}",
+                    f"Version: {backup['version']}",
+                    f"Size: {size_mb:.2f} MB"
+                ])
+            sys.stdout.write("\n".join(lines) + "\n")
                 
         elif args.command == 'restore':
             backup_path = Path(args.backup_name)
@@ -206,4 +217,48 @@ def backup_main() -> None:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
+def web_search_main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for the web-search command.
+    
+    The search module, and aiohttp with it, is only imported when the
+    command runs.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    configure_structlog()
+    parser = argparse.ArgumentParser(
+        description='Search the web via SearxNG',
+        prog='web-search'
+    )
+    parser.add_argument('query', help='Search query')
+    parser.add_argument('--num-results', '-n', type=int, default=5,
+                        help='Number of results to return')
+    parser.add_argument('--timeout', '-t', type=int, default=30,
+                        help='Search timeout in seconds')
+    args = parser.parse_args(argv)
+    
+    try:
+        import asyncio
+        from .search.searxng import web_search
+        results = asyncio.run(web_search(args.query, args.num_results, args.timeout))
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    
+    if not results:
+        print("No results found.")
+        return
+    
+    lines = []
+    for i, result in enumerate(results, 1):
+        lines.append(f"\n{i}. {result['title']}")
+        lines.append(f"URL: {result['url']}")
+        if result['published_date']:
+            lines.append(f"Published: {result['published_date']}")
+        lines.append(f"Source: {result['source']}")
+        lines.append(f"\n{result['snippet']}\n")
+        lines.append("-" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
+
 # Similar updates for answer_main() and thought_main()... 
\ No newline at end of file
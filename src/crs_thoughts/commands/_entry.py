@@ -0,0 +1,62 @@
+"""Shared handler logic for entry commands."""
+
+from datetime import datetime
+import uuid
+from typing import Any, Optional
+
+from ..utils.formatting import is_blank
+from ..utils.storage import Storage
+from ..exceptions import ValidationError, StorageError
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+def handle_entry(
+    kind: str,
+    storage: Storage,
+    content: str,
+    username: str,
+    timestamp: datetime,
+    entry_uuid: uuid.UUID,
+    session_uuid: Optional[uuid.UUID] = None,
+    **fields: Any
+) -> None:
+    """Validate an entry and hand it to storage.
+    
+    Args:
+        kind: Entry kind ('question', 'answer' or 'thought')
+        storage: Storage instance for persistence
+        content: The entry text
+        username: Author of the entry
+        timestamp: Time of creation
+        entry_uuid: UUID for the entry
+        session_uuid: Optional session UUID
+        **fields: Kind-specific fields passed through to ``store_<kind>``
+        
+    Raises:
+        ValidationError: If the input data is invalid
+        StorageError: If there's an error storing the entry
+    """
+    logger.info(f"handling_{kind}",
+                username=username,
+                entry_uuid=entry_uuid,
+                session_uuid=session_uuid,
+                **fields)
+    
+    if is_blank(content):
+        logger.error(f"empty_{kind}_content")
+        raise ValidationError(f"{kind.capitalize()} content cannot be empty")
+    
+    try:
+        getattr(storage, f'store_{kind}')(
+            content=content,
+            username=username,
+            timestamp=timestamp,
+            entry_uuid=entry_uuid,
+            session_uuid=session_uuid,
+            **fields
+        )
+        logger.info(f"{kind}_stored_successfully", entry_uuid=entry_uuid, **fields)
+    except Exception as e:
+        logger.error(f"{kind}_storage_failed", error=str(e))
+        raise StorageError(f"Failed to store {kind}: {str(e)}") from e
@@ -1,15 +1,26 @@
 """Handler for answer commands."""
 
+import functools
 from datetime import datetime
 import uuid
 from typing import Optional
 
 from ..utils.storage import Storage
-from ..exceptions import ValidationError, StorageError
+from ..exceptions import ValidationError
+from ._entry import handle_entry
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+@functools.lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> uuid.UUID:
+    """Parse a UUID string, reusing results for repeated question UUIDs.
+    
+    Raises:
+        ValueError: If the string is not a valid UUID (never cached)
+    """
+    return uuid.UUID(value)
+
 def handle_answer(
     storage: Storage,
     content: str,
@@ -34,29 +45,11 @@ def handle_answer(
         ValidationError: If the input data is invalid
         StorageError: If there's an error storing the answer
     """
-    logger.info("handling_answer", 
-                username=username,
-                entry_uuid=str(entry_uuid),
-                question_uuid=question_uuid,
-                session_uuid=str(session_uuid) if session_uuid else None)
-    
-    if not content.strip():
-        logger.error("empty_answer_content")
-        raise ValidationError("Answer content cannot be empty")
-    
     try:
-        storage.store_answer(
-            content=content,
-            username=username,
-            timestamp=timestamp,
-            entry_uuid=entry_uuid,
-            question_uuid=uuid.UUID(question_uuid) if question_uuid else None,
-            session_uuid=session_uuid
-        )
-        logger.info("answer_stored_successfully", entry_uuid=str(entry_uuid))
+        parsed_uuid = _parse_uuid(question_uuid) if question_uuid else None
     except ValueError as e:
         logger.error("invalid_question_uuid", error=str(e))
         raise ValidationError(f"Invalid question UUID: {str(e)}") from e
-    except Exception as e:
-        logger.error("answer_storage_failed", error=str(e))
-        raise StorageError(f"Failed to store answer: {str(e)}") from e 
\ No newline at end of file
+    
+    handle_entry('answer', storage, content, username, timestamp,
+                 entry_uuid, session_uuid, question_uuid=parsed_uuid)
\ No newline at end of file
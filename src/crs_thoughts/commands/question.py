@@ -5,10 +5,7 @@ import uuid
 from typing import Optional
 
 from ..utils.storage import Storage
-from ..exceptions import ValidationError, StorageError
-import structlog
-
-logger = structlog.get_logger(__name__)
+from ._entry import handle_entry
 
 def handle_question(
     storage: Storage,
@@ -32,24 +29,5 @@ def handle_question(
         ValidationError: If the input data is invalid
         StorageError: If there's an error storing the question
     """
-    logger.info("handling_question", 
-                username=username, 
-                entry_uuid=str(entry_uuid),
-                session_uuid=str(session_uuid) if session_uuid else None)
-    
-    if not content.strip():
-        logger.error("empty_question_content")
-        raise ValidationError("Question content cannot be empty")
-        
-    try:
-        storage.store_question(
-            content=content,
-            username=username,
-            timestamp=timestamp,
-            entry_uuid=entry_uuid,
-            session_uuid=session_uuid
-        )
-        logger.info("question_stored_successfully", entry_uuid=str(entry_uuid))
-    except Exception as e:
-        logger.error("question_storage_failed", error=str(e))
-        raise StorageError(f"Failed to store question: {str(e)}") from e 
\ No newline at end of file
+    handle_entry('question', storage, content, username, timestamp,
+                 entry_uuid, session_uuid)
\ No newline at end of file
@@ -5,10 +5,7 @@ import uuid
 from typing import Optional, List
 
 from ..utils.storage import Storage
-from ..exceptions import ValidationError, StorageError
-import structlog
-
-logger = structlog.get_logger(__name__)
+from ._entry import handle_entry
 
 def handle_thought(
     storage: Storage,
@@ -34,28 +31,5 @@ def handle_thought(
         ValidationError: If the input data is invalid
         StorageError: If there's an error storing the thought
     """
-    logger.info("handling_thought", 
-                username=username,
-                entry_uuid=str(entry_uuid),
-                tags=tags,
-                session_uuid=str(session_uuid) if session_uuid else None)
-    
-    if not content.strip():
-        logger.error("empty_thought_content")
-        raise ValidationError("Thought content cannot be empty")
-    
-    try:
-        storage.store_thought(
-            content=content,
-            username=username,
-            timestamp=timestamp,
-            entry_uuid=entry_uuid,
-            tags=tags or [],
-            session_uuid=session_uuid
-        )
-        logger.info("thought_stored_successfully", 
-                   entry_uuid=str(entry_uuid),
-                   tags=tags)
-    except Exception as e:
-        logger.error("thought_storage_failed", error=str(e))
-        raise StorageError(f"Failed to store thought: {str(e)}") from e 
\ No newline at end of file
+    handle_entry('thought', storage, content, username, timestamp,
+                 entry_uuid, session_uuid, tags=tags or [])
\ No newline at end of file
@@ -1,22 +1,28 @@
 """Configuration management for crs_thoughts."""
 
+import functools
+import hashlib
+import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
-import yaml
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Any, Dict, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
 import structlog
 
 from ..exceptions import ConfigurationError
 
 logger = structlog.get_logger(__name__)
 
+# Written by ``_save_config`` together with a checksum of the body; files
+# whose checksum still matches are trusted on load
+CONFIG_SCHEMA_VERSION = 1
+
+# Parsed settings keyed by (path, mtime_ns, size) of the file they came from
+_SETTINGS_CACHE: Dict[Tuple[str, int, int], "Settings"] = {}
+
 class AISettings(BaseModel):
     """AI service configuration."""
-    model_config = ConfigDict(
-        extra='forbid',
-        validate_assignment=True
-    )
+    model_config = ConfigDict(extra='forbid', frozen=True)
     
     enabled: bool = True
     url: str = "http://localhost:11434"
@@ -24,22 +30,100 @@ class AISettings(BaseModel):
 
 class SearchConfig(BaseModel):
     """Search integration configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     enabled: bool = True
     url: str = "http://nomnom:4000"
 
+# Defaults resolved once; the frozen sub-models are shared by every Settings
+_DEFAULT_USERNAME = os.getenv('USER', 'unknown')
+_DEFAULT_STORAGE_DIR = Path.home() / '.crs_thoughts'
+_DEFAULT_AI = AISettings()
+_DEFAULT_SEARCH = SearchConfig()
+
 class Settings(BaseModel):
     """Global application settings."""
-    username: str = Field(default_factory=lambda: os.getenv('USER', 'unknown'))
+    username: str = _DEFAULT_USERNAME
     current_session: Optional[str] = None
     datetime_format: str = "%Y-%m-%dT%H:%M:%S"
-    storage_dir: Path = Field(default_factory=lambda: Path.home() / '.crs_thoughts')
-    ai: AISettings = Field(default_factory=AISettings)
-    search: SearchConfig = Field(default_factory=SearchConfig)
+    storage_dir: Path = _DEFAULT_STORAGE_DIR
+    ai: AISettings = _DEFAULT_AI
+    search: SearchConfig = _DEFAULT_SEARCH
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True
     )
 
+@functools.lru_cache(maxsize=None)
+def _yaml() -> Tuple[Any, Any, Any]:
+    """Import PyYAML on first use.
+    
+    Returns:
+        Tuple of the yaml module and the fastest available safe loader
+        and dumper classes
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:  # pragma: no cover - PyYAML built without LibYAML
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+def _construct_settings(config_data: Dict[str, Any]) -> Settings:
+    """Build settings from data this application wrote itself.
+    
+    Skips validation, so only the coercions the YAML round trip loses
+    are applied by hand.
+    
+    Args:
+        config_data: Parsed configuration file contents
+        
+    Returns:
+        Settings object with configuration values
+    """
+    data = dict(config_data)
+    if 'ai' in data:
+        data['ai'] = AISettings.model_construct(**data['ai'])
+    if 'search' in data:
+        data['search'] = SearchConfig.model_construct(**data['search'])
+    if 'storage_dir' in data:
+        data['storage_dir'] = Path(data['storage_dir'])
+    return Settings.model_construct(**data)
+
+def _checksum(config_data: Dict[str, Any]) -> str:
+    """Hash the configuration body as written by ``_save_config``.
+    
+    Args:
+        config_data: Configuration values without the schema markers
+        
+    Returns:
+        Hex digest of the canonical JSON form of the values
+    """
+    body = json.dumps(config_data, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+
+def _cache_key(config_file: Path) -> Tuple[str, int, int]:
+    """Build the settings cache key for a configuration file.
+    
+    Args:
+        config_file: Path to the configuration file
+        
+    Returns:
+        Tuple of path, modification time and size
+    """
+    stat = config_file.stat()
+    return (str(config_file), stat.st_mtime_ns, stat.st_size)
+
+def _evict_cached_settings(config_file: Path) -> None:
+    """Drop every cached settings object parsed from a file.
+    
+    Args:
+        config_file: Path to the configuration file
+    """
+    path = str(config_file)
+    for key in [key for key in _SETTINGS_CACHE if key[0] == path]:
+        del _SETTINGS_CACHE[key]
+
 class ConfigManager:
     """Manages application configuration."""
     
@@ -58,17 +142,36 @@ class ConfigManager:
         Raises:
             ConfigurationError: If configuration file is invalid
         """
-        if not self.config_file.exists():
+        try:
+            key = _cache_key(self.config_file)
+        except FileNotFoundError:
             logger.info("config_file_not_found_creating_default")
             return self._create_default_config()
+        
+        cached = _SETTINGS_CACHE.get(key)
+        if cached is not None:
+            return cached
 
         try:
+            yaml, loader, _ = _yaml()
             with self.config_file.open('r') as f:
-                config_data = yaml.safe_load(f)
-            return Settings(**config_data) if config_data else Settings()
+                config_data = yaml.load(f, Loader=loader)
+            if not config_data:
+                settings = Settings()
+            else:
+                version = config_data.pop('schema_version', None)
+                checksum = config_data.pop('schema_checksum', None)
+                if version == CONFIG_SCHEMA_VERSION and checksum == _checksum(config_data):
+                    settings = _construct_settings(config_data)
+                else:
+                    # Older, hand-edited or otherwise modified file: validate everything
+                    settings = Settings(**config_data)
         except Exception as e:
             logger.error("config_load_failed", error=str(e))
             raise ConfigurationError(f"Failed to load configuration: {str(e)}") from e
+        
+        _SETTINGS_CACHE[key] = settings
+        return settings
 
     def _create_default_config(self) -> Settings:
         """Create default configuration file.
@@ -90,9 +193,15 @@ class ConfigManager:
             ConfigurationError: If saving configuration fails
         """
         try:
+            yaml, _, dumper = _yaml()
             self.config_dir.mkdir(parents=True, exist_ok=True)
             with self.config_file.open('w') as f:
-                yaml.safe_dump(settings.dict(), f)
+                config_data = settings.model_dump(mode='json')
+                config_data['schema_checksum'] = _checksum(config_data)
+                config_data['schema_version'] = CONFIG_SCHEMA_VERSION
+                yaml.dump(config_data, f, Dumper=dumper, default_flow_style=False)
+            _evict_cached_settings(self.config_file)
+            _SETTINGS_CACHE[_cache_key(self.config_file)] = settings
         except Exception as e:
             logger.error("config_save_failed", error=str(e))
             raise ConfigurationError(f"Failed to save configuration: {str(e)}") from e
@@ -126,9 +235,26 @@ class ConfigManager:
             ConfigurationError: If setting is invalid
         """
         try:
-            setattr(self.settings, key, value)
+            if key not in Settings.model_fields:
+                raise ValueError(f"Unknown setting: {key}")
+            # External input, so validate it before it reaches the file
+            self.settings = Settings.model_validate(
+                {**self.settings.model_dump(), key: value}
+            )
             self._save_config(self.settings)
             logger.info("setting_updated", key=key)
         except Exception as e:
             logger.error("setting_update_failed", key=key, error=str(e))
-            raise ConfigurationError(f"Failed to update setting: {str(e)}") from e 
\ No newline at end of file
+            raise ConfigurationError(f"Failed to update setting: {str(e)}") from e
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> ConfigManager:
+    """Get the process-wide configuration manager.
+    
+    The configuration file is read once and shared by every service.
+    Call ``get_config.cache_clear()`` to force it to be reloaded.
+    
+    Returns:
+        Shared ConfigManager instance
+    """
+    return ConfigManager()
@@ -1,36 +1,72 @@
 """Base models for entries in the system."""
 
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from uuid import UUID, uuid4
-from typing import Optional, List
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Any, Dict, Optional, List
 
-class EntryBase(BaseModel):
+from ..utils import clock
+
+# Slotted, keyword-only records where the interpreter supports them
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {'slots': True, 'kw_only': True} if sys.version_info >= (3, 10) else {}
+)
+
+@dataclass(**_DATACLASS_OPTIONS)
+class EntryBase:
     """Base model for all entries."""
-    id: UUID = Field(default_factory=uuid4, alias='uuid')
-    timestamp: datetime = Field(default_factory=datetime.now)
     username: str
     content: str
+    uuid: UUID = field(default_factory=uuid4)
+    timestamp: datetime = field(default_factory=clock.now)
     session_uuid: Optional[UUID] = None
+    # String form of the UUID, filled in on first use of ``uuid_str``
+    _uuid_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def id(self) -> UUID:
+        """UUID of the entry."""
+        return self.uuid
+
+    @property
+    def uuid_str(self) -> str:
+        """String form of the entry UUID, formatted once and reused."""
+        if self._uuid_str is None:
+            self._uuid_str = str(self.uuid)
+        return self._uuid_str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the entry to a JSON-compatible dictionary.
 
-    model_config = ConfigDict(
-        json_encoders={
-            datetime: lambda v: v.isoformat(),
-            UUID: str
-        },
-        arbitrary_types_allowed=True,
-        populate_by_name=True,
-        allow_population_by_field_name=True
-    )
+        Returns:
+            Field values with UUIDs as strings and timestamps in ISO format
+        """
+        data = {}
+        for entry_field in fields(self):
+            if not entry_field.init:
+                continue
+            if entry_field.name == 'uuid':
+                data['uuid'] = self.uuid_str
+                continue
+            value = getattr(self, entry_field.name)
+            if isinstance(value, UUID):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            data[entry_field.name] = value
+        return data
 
+@dataclass(**_DATACLASS_OPTIONS)
 class Question(EntryBase):
     """Model for question entries."""
-    pass
 
+@dataclass(**_DATACLASS_OPTIONS)
 class Answer(EntryBase):
     """Model for answer entries."""
     question_uuid: Optional[UUID] = None
 
+@dataclass(**_DATACLASS_OPTIONS)
 class Thought(EntryBase):
     """Model for thought entries."""
-    tags: List[str] = Field(default_factory=list) 
\ No newline at end of file
+    tags: List[str] = field(default_factory=list)
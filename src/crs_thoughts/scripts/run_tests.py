@@ -1,50 +1,74 @@
 """Script to run tests and manage test output."""
 
+import os
+import select
 import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
 import re
 import asyncio
-import aiohttp
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Optional
 import structlog
 
+from .._compat import loads
+from .._constants import OLLAMA_TAGS_PATH, OLLAMA_VERSION_PATH, REQUIRED_MODELS
+from .verify_ollama import ollama_session
+
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = structlog.get_logger(__name__)
 
+async def _get_json(session: "aiohttp.ClientSession", path: str) -> Optional[Dict[str, Any]]:
+    """Fetch a JSON document from Ollama.
+    
+    Args:
+        session: Session created by ollama_session()
+        path: API path to request
+        
+    Returns:
+        Decoded response, or None if the request did not succeed
+    """
+    async with session.get(path) as response:
+        if response.status != 200:
+            return None
+        return await response.json(loads=loads)
+
 async def verify_ollama() -> bool:
     """Verify Ollama is running and models are available."""
     try:
-        async with aiohttp.ClientSession() as session:
-            # Check if Ollama is running
-            async with session.get("http://localhost:11434/api/version") as response:
-                if response.status != 200:
-                    logger.error("ollama_not_running")
-                    return False
-                version_data = await response.json()
-                logger.info("ollama_running", version=version_data.get('version'))
-
-            # Check for required models
-            async with session.get("http://localhost:11434/api/tags") as response:
-                if response.status != 200:
-                    logger.error("ollama_models_check_failed")
-                    return False
-                data = await response.json()
-                models = [model['name'] for model in data.get('models', [])]
-                required_models = ["llama3.2:latest", "nomic-embed-text:v1.5"]
-                missing = [m for m in required_models if m not in models]
-                
-                if missing:
-                    logger.error("missing_required_models", models=missing)
-                    print("\nMissing required Ollama models:")
-                    for model in missing:
-                        print(f"  - {model}")
-                    print("\nPlease install missing models with:")
-                    for model in missing:
-                        print(f"  ollama pull {model}")
-                    return False
-                
-                logger.info("required_models_available")
-                return True
+        async with ollama_session() as session:
+            # Both checks are independent, so issue them together
+            version_data, data = await asyncio.gather(
+                _get_json(session, OLLAMA_VERSION_PATH),
+                _get_json(session, OLLAMA_TAGS_PATH)
+            )
+        
+        if version_data is None:
+            logger.error("ollama_not_running")
+            return False
+        logger.info("ollama_running", version=version_data.get('version'))
+        
+        # Check for required models
+        if data is None:
+            logger.error("ollama_models_check_failed")
+            return False
+        models = {model['name'] for model in data.get('models', [])}
+        missing = sorted(REQUIRED_MODELS.difference(models))
+        
+        if missing:
+            logger.error("missing_required_models", models=missing)
+            print("\nMissing required Ollama models:")
+            for model in missing:
+                print(f"  - {model}")
+            print("\nPlease install missing models with:")
+            for model in missing:
+                print(f"  ollama pull {model}")
+            return False
+        
+        logger.info("required_models_available")
+        return True
                 
     except Exception as e:
         logger.error("ollama_verification_failed", error=str(e))
@@ -52,100 +76,131 @@ async def verify_ollama() -> bool:
         print("Start Ollama with: ollama serve")
         return False
 
-def run_tests() -> tuple[str, int]:
-    """Run pytest and capture output."""
+def run_tests() -> tuple[bytearray, int]:
+    """Run pytest and capture its raw output in a single buffer."""
     log_dir = Path('logs')
     log_dir.mkdir(exist_ok=True)
     
     # First verify Ollama
     if not asyncio.run(verify_ollama()):
-        return "Ollama verification failed", 1
+        return bytearray(b"Ollama verification failed"), 1
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     full_log_file = log_dir / f'pytest_full_{timestamp}.log'
     
-    # Run pytest and tee output to both console and file
-    with full_log_file.open('w') as f:
+    # Run pytest and tee raw output chunks to both console and file
+    sys.stdout.flush()
+    console = getattr(sys.stdout, 'buffer', None)
+    if console is None:
+        # Replaced stdout (e.g. in an IDE) that only accepts text
+        console = sys.stdout
+        
+        def write_console(chunk: bytes) -> None:
+            console.write(chunk.decode(errors='replace'))
+    else:
+        write_console = console.write
+    with full_log_file.open('wb') as f:
         process = subprocess.Popen(
             ["pytest", "-v", "--full-trace"],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1  # Line buffered
+            bufsize=0
         )
         
-        output = []
-        while True:
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                break
-            if line:
-                # Write to file
-                f.write(line)
-                f.flush()  # Ensure it's written immediately
-                
-                # Write to console
-                sys.stdout.write(line)
-                sys.stdout.flush()
-                
-                output.append(line)
+        output = bytearray()
+        for chunk in _iter_output(process.stdout):
+            if not chunk:
+                # Output went quiet, so show what we have so far
+                f.flush()
+                console.flush()
+                continue
+            f.write(chunk)
+            write_console(chunk)
+            output += chunk
         
+        console.flush()
         return_code = process.wait()
     
-    return ''.join(output), return_code
+    return output, return_code
 
-def extract_errors(output: str) -> str:
-    """Extract error messages from pytest output.
+def _iter_output(stdout: IO[bytes]) -> Iterator[bytes]:
+    """Yield output from a subprocess pipe as it arrives.
+    
+    On POSIX the pipe is polled, so partial lines show up while a slow test
+    runs. ``select`` only supports sockets on Windows, so there the pipe is
+    read a line at a time instead.
     
     Args:
-        output: Raw pytest output
+        stdout: Binary, unbuffered pipe to read from
         
-    Returns:
-        String containing only error messages
+    Yields:
+        Raw output chunks, or an empty chunk when output has gone quiet
     """
-    # Split output into lines
-    lines = output.split('\n')
-    error_lines = []
-    in_error_block = False
-    
-    for line in lines:
-        # Start of error section
-        if line.startswith('=') and ('ERROR' in line or 'FAIL' in line):
-            in_error_block = True
-            error_lines.append(line)
-        # End of error section
-        elif line.startswith('=') and in_error_block:
-            in_error_block = False
-            error_lines.append(line)
-        # Coverage failure
-        elif 'Coverage failure:' in line:
-            error_lines.append(line)
-        # Lines within error block
-        elif in_error_block:
-            error_lines.append(line)
+    if os.name != 'posix':
+        yield from stdout
+        return
     
-    return '\n'.join(error_lines)
+    fd = stdout.fileno()
+    os.set_blocking(fd, False)
+    while True:
+        ready, _, _ = select.select([fd], [], [], 0.1)
+        if not ready:
+            yield b''
+            continue
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            continue
+        if not chunk:  # EOF
+            return
+        yield chunk
 
-def save_output(errors: str) -> None:
-    """Save error output to log file.
+# An error banner plus its body, up to and including the closing '=' line
+# (left for the next match if that line opens another error section), or
+# a stray coverage failure line.
+_ERROR_RE = re.compile(
+    rb'^=[^\n]*(?:ERROR|FAIL)[^\n]*'
+    rb'(?:\n(?!=)[^\n]*)*'
+    rb'(?:\n=(?![^\n]*(?:ERROR|FAIL))[^\n]*)?'
+    rb'|^[^\n]*Coverage failure:[^\n]*',
+    re.MULTILINE
+)
+
+def stream_errors_to(output: bytes, log_file: Path) -> bytes:
+    """Write error messages from pytest output straight to a log file.
+    
+    The output is scanned once and each error section is written as soon
+    as it is found.
     
     Args:
-        errors: Error messages to save
+        output: Raw pytest output
+        log_file: File to write the error messages to
+        
+    Returns:
+        The error messages written, for echoing to the console
     """
-    log_dir = Path('logs')
-    log_dir.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file = log_dir / f'test_errors_{timestamp}.log'
-    
-    # Save latest errors
-    log_file.write_text(errors)
+    errors = bytearray()
+    with log_file.open('wb') as f:
+        for match in _ERROR_RE.finditer(output):
+            if errors:
+                f.write(b'\n')
+                errors += b'\n'
+            section = match.group(0)
+            f.write(section)
+            errors += section
+    return bytes(errors)
+
+def link_latest(log_file: Path) -> None:
+    """Atomically point logs/latest_errors.log at a log file.
     
-    # Create/update latest link
-    latest_link = log_dir / 'latest_errors.log'
-    if latest_link.exists():
-        latest_link.unlink()
-    latest_link.symlink_to(log_file.name)
+    Args:
+        log_file: Error log to link to
+    """
+    latest_link = log_file.parent / 'latest_errors.log'
+    tmp_link = latest_link.with_name(latest_link.name + '.tmp')
+    tmp_link.unlink(missing_ok=True)
+    tmp_link.symlink_to(log_file.name)
+    os.replace(tmp_link, latest_link)
 
 def main() -> None:
     """Main entry point."""
@@ -153,12 +208,14 @@ def main() -> None:
     output, return_code = run_tests()
     
     if return_code != 0:
-        errors = extract_errors(output)
-        save_output(errors)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        log_file = Path('logs') / f'test_errors_{timestamp}.log'
+        errors = stream_errors_to(output, log_file)
+        link_latest(log_file)
         print("\nErrors found! See logs/latest_errors.log for details.")
         print("\nLatest errors:")
         print("=" * 80)
-        print(errors)
+        print(errors.decode(errors='replace'))
         print("\nFull test output saved to logs/pytest_full_*.log")
     else:
         print("\nAll tests passed!")
@@ -1,17 +1,18 @@
 """Script to test basic Ollama prompt functionality."""
 
 import asyncio
-import aiohttp
 import click
 import structlog
-from urllib.parse import urljoin
 
-logger = structlog.get_logger(__name__)
+from .._compat import loads
+from .._constants import OLLAMA_GENERATE_URL
 
-OLLAMA_URL = "http://localhost:11434"
+logger = structlog.get_logger(__name__)
 
 async def test_prompt():
     """Test basic prompt to Ollama."""
+    import aiohttp
+    
     prompt = "Say 'Hello, World!' and nothing else."
     
     payload = {
@@ -31,7 +32,7 @@ async def test_prompt():
         async with aiohttp.ClientSession() as session:
             logger.info("sending_prompt", prompt=prompt)
             async with session.post(
-                urljoin(OLLAMA_URL, "/api/generate"),
+                OLLAMA_GENERATE_URL,
                 json=payload,
                 timeout=30
             ) as response:
@@ -42,7 +43,7 @@ async def test_prompt():
                                error=error_text)
                     return
                 
-                data = await response.json()
+                data = await response.json(loads=loads)
                 if 'error' in data:
                     logger.error("ollama_error", error=data['error'])
                     return
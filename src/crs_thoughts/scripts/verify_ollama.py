@@ -1,43 +1,70 @@
 """Script to verify Ollama installation and required models."""
 
 import asyncio
-import aiohttp
 import sys
 import click
 import logging
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any
 import structlog
-import json
+
+from .._compat import loads
+from .._constants import (
+    OLLAMA_BASE_URL,
+    OLLAMA_PULL_PATH,
+    OLLAMA_TAGS_PATH,
+    OLLAMA_VERSION_PATH,
+    REQUIRED_MODELS,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = structlog.get_logger(__name__)
 
-REQUIRED_MODELS = [
-    "llama3.2:latest",
-    "nomic-embed-text:v1.5"
-]
+# Models pulled at once, so several large downloads don't saturate the uplink
+MAX_CONCURRENT_PULLS = 2
 
-OLLAMA_BASE_URL = "http://localhost:11434"
+def ollama_session() -> "aiohttp.ClientSession":
+    """Create a keep-alive session for talking to the local Ollama server.
+    
+    Use it as ``async with ollama_session() as session:`` and pass the
+    session to the helpers below so they share one connection pool.
+    
+    Returns:
+        Client session with request paths relative to OLLAMA_BASE_URL
+    """
+    # Deferred so importing this module stays cheap
+    import aiohttp
+    
+    return aiohttp.ClientSession(
+        base_url=OLLAMA_BASE_URL,
+        connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=30)
+    )
 
-async def check_ollama_health() -> Dict[str, Any]:
+async def check_ollama_health(session: "aiohttp.ClientSession") -> Dict[str, Any]:
     """Check if Ollama is running.
     
+    Args:
+        session: Session created by ollama_session()
+    
     Returns:
         Dict containing version info if successful
     """
+    import aiohttp
+    
     try:
-        async with aiohttp.ClientSession() as session:
-            # First try /api/version which should always work if Ollama is running
-            async with session.get(f"{OLLAMA_BASE_URL}/api/version", timeout=5) as response:
-                if response.status == 200:
-                    version_data = await response.json()
-                    logger.info("ollama_running", version=version_data.get('version'))
-                    return version_data
-                else:
-                    error_text = await response.text()
-                    logger.error("ollama_health_check_failed", 
-                               status=response.status,
-                               error=error_text)
-                    return {}
+        # First try /api/version which should always work if Ollama is running
+        async with session.get(OLLAMA_VERSION_PATH, timeout=5) as response:
+            if response.status == 200:
+                version_data = await response.json(loads=loads)
+                logger.info("ollama_running", version=version_data.get('version'))
+                return version_data
+            else:
+                error_text = await response.text()
+                logger.error("ollama_health_check_failed", 
+                           status=response.status,
+                           error=error_text)
+                return {}
     except aiohttp.ClientError as e:
         logger.error("ollama_connection_failed", error=str(e))
         return {}
@@ -45,45 +72,52 @@ async def check_ollama_health() -> Dict[str, Any]:
         logger.error("ollama_health_check_failed", error=str(e))
         return {}
 
-async def list_installed_models() -> List[str]:
-    """Get list of installed Ollama models."""
+async def list_installed_models(session: "aiohttp.ClientSession") -> List[str]:
+    """Get list of installed Ollama models.
+    
+    Args:
+        session: Session created by ollama_session()
+    """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=5) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    models = [model['name'] for model in data.get('models', [])]
-                    logger.info("models_found", count=len(models), models=models)
-                    return models
-                else:
-                    error_text = await response.text()
-                    logger.error("list_models_failed", 
-                               status=response.status,
-                               error=error_text)
+        async with session.get(OLLAMA_TAGS_PATH, timeout=5) as response:
+            if response.status == 200:
+                data = await response.json(loads=loads)
+                models = [model['name'] for model in data.get('models', [])]
+                logger.info("models_found", count=len(models), models=models)
+                return models
+            else:
+                error_text = await response.text()
+                logger.error("list_models_failed", 
+                           status=response.status,
+                           error=error_text)
     except Exception as e:
         logger.error("list_models_failed", error=str(e))
     return []
 
-async def pull_model(model_name: str) -> bool:
-    """Pull an Ollama model."""
+async def pull_model(session: "aiohttp.ClientSession", model_name: str) -> bool:
+    """Pull an Ollama model.
+    
+    Args:
+        session: Session created by ollama_session()
+        model_name: Name of the model to pull
+    """
     try:
-        async with aiohttp.ClientSession() as session:
-            click.echo(f"Pulling {model_name}... This may take a while.")
-            async with session.post(
-                f"{OLLAMA_BASE_URL}/api/pull",
-                json={"name": model_name},
-                timeout=600  # 10 minutes timeout for model pulling
-            ) as response:
-                if response.status == 200:
-                    logger.info("model_pulled_successfully", model=model_name)
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error("model_pull_failed", 
-                               model=model_name, 
-                               status=response.status,
-                               error=error_text)
-                    return False
+        click.echo(f"Pulling {model_name}... This may take a while.")
+        async with session.post(
+            OLLAMA_PULL_PATH,
+            json={"name": model_name},
+            timeout=600  # 10 minutes timeout for model pulling
+        ) as response:
+            if response.status == 200:
+                logger.info("model_pulled_successfully", model=model_name)
+                return True
+            else:
+                error_text = await response.text()
+                logger.error("model_pull_failed", 
+                           model=model_name, 
+                           status=response.status,
+                           error=error_text)
+                return False
     except Exception as e:
         logger.error("model_pull_failed", model=model_name, error=str(e))
         return False
@@ -105,43 +139,56 @@ def main(install: bool, debug: bool, timeout: int) -> None:
         )
     
     async def run():
-        # Check if Ollama is running
-        click.echo("Checking Ollama status...")
-        version_info = await check_ollama_health()
-        if not version_info:
-            click.echo("\nError: Could not connect to Ollama. Please ensure:", err=True)
-            click.echo("1. Ollama is installed (run: curl https://ollama.ai/install.sh | sh)")
-            click.echo("2. Ollama service is running (run: ollama serve)")
-            click.echo("3. Port 11434 is accessible (check: curl http://localhost:11434)")
-            sys.exit(1)
-        
-        click.echo(f"✓ Ollama is running (version: {version_info.get('version')})")
-        
-        # Check installed models
-        click.echo("\nChecking installed models...")
-        installed_models = await list_installed_models()
-        missing_models = [m for m in REQUIRED_MODELS if m not in installed_models]
-        
-        if not missing_models:
-            click.echo("✓ All required models are installed")
-            return
-        
-        click.echo("\nMissing required models:")
-        for model in missing_models:
-            click.echo(f"  - {model}")
-        
-        if install:
-            click.echo("\nInstalling missing models...")
-            for model in missing_models:
-                if await pull_model(model):
-                    click.echo(f"✓ Installed {model}")
-                else:
-                    click.echo(f"✗ Failed to install {model}", err=True)
-        else:
-            click.echo("\nTo install missing models, run:")
+        async with ollama_session() as session:
+            # Check if Ollama is running and which models it has in one round trip
+            click.echo("Checking Ollama status...")
+            version_info, installed_models = await asyncio.gather(
+                check_ollama_health(session),
+                list_installed_models(session)
+            )
+            if not version_info:
+                click.echo("\nError: Could not connect to Ollama. Please ensure:", err=True)
+                click.echo("1. Ollama is installed (run: curl https://ollama.ai/install.sh | sh)")
+                click.echo("2. Ollama service is running (run: ollama serve)")
+                click.echo("3. Port 11434 is accessible (check: curl http://localhost:11434)")
+                sys.exit(1)
+            
+            click.echo(f"✓ Ollama is running (version: {version_info.get('version')})")
+            
+            # Check installed models
+            click.echo("\nChecking installed models...")
+            missing_models = sorted(REQUIRED_MODELS.difference(installed_models))
+            
+            if not missing_models:
+                click.echo("✓ All required models are installed")
+                return
+            
+            click.echo("\nMissing required models:")
             for model in missing_models:
-                click.echo(f"  ollama pull {model}")
-            sys.exit(1)
+                click.echo(f"  - {model}")
+            
+            if install:
+                click.echo("\nInstalling missing models...")
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_PULLS)
+                
+                async def pull(model: str) -> bool:
+                    async with semaphore:
+                        return await pull_model(session, model)
+                
+                results = await asyncio.gather(
+                    *(pull(model) for model in missing_models),
+                    return_exceptions=True
+                )
+                for model, ok in zip(missing_models, results):
+                    if ok is True:
+                        click.echo(f"✓ Installed {model}")
+                    else:
+                        click.echo(f"✗ Failed to install {model}", err=True)
+            else:
+                click.echo("\nTo install missing models, run:")
+                for model in missing_models:
+                    click.echo(f"  ollama pull {model}")
+                sys.exit(1)
 
     asyncio.run(run())
 
@@ -1,24 +1,58 @@
 """SearxNG search integration."""
 
 import asyncio
-import aiohttp
-import click
-from typing import List, Dict, Any, Optional
+import heapq
+import operator
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 import structlog
 from urllib.parse import urljoin
-import backoff  # For retry logic
 
-from ..config.settings import ConfigManager
+from .._compat import loads
+from ..config.settings import get_config
 from ..exceptions import SearchError
+from ..utils.http import close_shared_session, get_session, import_aiohttp
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = structlog.get_logger(__name__)
 
+# Searches a single caller may have in flight against the SearxNG host
+MAX_CONCURRENT_SEARCHES = 8
+
+# Seconds to wait before each retry of a failed search request
+_RETRY_DELAYS = (0.5, 2.0)
+
+class _SearchTimeoutError(SearchError):
+    """Raised when SearxNG does not answer in time; not worth retrying."""
+
+# Query parameters that are the same for every search request
+_BASE_PARAMS = MappingProxyType({
+    'format': 'json',
+    'pageno': 1,
+    'categories': 'general',
+    'language': 'en'
+})
+
+# Connection pool for SearxNG; queries from all search services share it
+_POOL = 'searxng'
+_POOL_LIMITS = MappingProxyType({
+    'limit': 100,
+    'limit_per_host': MAX_CONCURRENT_SEARCHES,
+    'keepalive_timeout': 75
+})
+
+async def _get_session() -> "aiohttp.ClientSession":
+    """Get the pooled client session for SearxNG requests."""
+    return await get_session(_POOL, **_POOL_LIMITS)
+
 class SearchService:
     """Service for performing web searches via SearxNG."""
     
     def __init__(self):
         """Initialize search service with configuration."""
-        self.config = ConfigManager()
+        self.config = get_config()
         self.search_config = self.config.settings.search
         
         if not self.search_config.enabled:
@@ -29,24 +63,23 @@ class SearchService:
             logger.error("search_url_missing")
             raise SearchError("Search URL not configured")
         
-        self.session: Optional[aiohttp.ClientSession] = None
+        self._search_url = urljoin(self.search_config.url, '/search')
+        # Borrowed from the shared pool while inside ``async with``
+        self.session: Optional["aiohttp.ClientSession"] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        self.session = await _get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
-
-    @backoff.on_exception(
-        backoff.expo,
-        (aiohttp.ClientError, SearchError),
-        max_tries=3,
-        giveup=lambda e: isinstance(e, SearchError) and "timeout" in str(e).lower()
-    )
+        """Async context manager exit.
+        
+        The shared session stays open for later services; it is closed by
+        ``close_shared_session`` or at interpreter exit.
+        """
+        self.session = None
+
     async def search(
         self,
         query: str,
@@ -66,21 +99,42 @@ class SearchService:
         Raises:
             SearchError: If search fails
         """
-        params = {
-            'q': query,
-            'format': 'json',
-            'pageno': 1,
-            'num_results': num_results,
-            'categories': 'general',
-            'language': 'en'
-        }
+        params = {**_BASE_PARAMS, 'q': query, 'num_results': num_results}
+        session = self.session or await _get_session()
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        for attempt, delay in enumerate((*_RETRY_DELAYS, None), start=1):
+            try:
+                return await self._get_results(session, query, params, timeout)
+            except SearchError as e:
+                if delay is None or isinstance(e, _SearchTimeoutError):
+                    raise
+                logger.info("retrying_search", attempt=attempt, error=str(e))
+                await asyncio.sleep(delay)
+
+    async def _get_results(
+        self,
+        session: "aiohttp.ClientSession",
+        query: str,
+        params: Dict[str, Any],
+        timeout: int
+    ) -> List[Dict[str, Any]]:
+        """Send a single search request to SearxNG.
         
+        Args:
+            session: Client session to send the request on
+            query: Search query string, for logging
+            params: Query parameters
+            timeout: Request timeout in seconds
+            
+        Returns:
+            List of search results
+            
+        Raises:
+            SearchError: If the request fails
+        """
         try:
-            async with self.session.get(
-                urljoin(self.search_config.url, '/search'),
+            async with session.get(
+                self._search_url,
                 params=params,
                 timeout=timeout
             ) as response:
@@ -93,7 +147,7 @@ class SearchService:
                         f"Search failed with status: {response.status}"
                     )
                 
-                data = await response.json()
+                data = await response.json(loads=loads)
                 if not data.get('results'):
                     logger.info("no_search_results", query=query)
                     return []
@@ -101,14 +155,44 @@ class SearchService:
                 return self._process_results(data['results'])
         except asyncio.TimeoutError:
             logger.error("search_timeout", query=query)
-            raise SearchError("Search request timed out")
-        except aiohttp.ClientError as e:
+            raise _SearchTimeoutError("Search request timed out")
+        except import_aiohttp().ClientError as e:
             logger.error("search_request_failed", error=str(e))
             raise SearchError(f"Failed to perform search: {str(e)}")
         except Exception as e:
             logger.error("unexpected_search_error", error=str(e))
             raise SearchError(f"Unexpected error during search: {str(e)}")
 
+    async def search_many(
+        self,
+        queries: List[str],
+        num_results: int = 5,
+        timeout: int = 30,
+        concurrency: int = MAX_CONCURRENT_SEARCHES
+    ) -> List[Union[List[Dict[str, Any]], BaseException]]:
+        """Perform several web searches concurrently.
+        
+        Args:
+            queries: Search query strings
+            num_results: Number of results to return per query
+            timeout: Request timeout in seconds
+            concurrency: Maximum number of searches in flight
+            
+        Returns:
+            Results for each query, in order; a failed query yields its
+            exception instead of raising
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def search_one(query: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.search(query, num_results, timeout)
+        
+        return await asyncio.gather(
+            *(search_one(query) for query in queries),
+            return_exceptions=True
+        )
+
     def _process_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process and format search results.
         
@@ -119,59 +203,51 @@ class SearchService:
             Processed search results
         """
         processed = []
+        append = processed.append
         for result in results:
-            processed_result = {
-                'title': result.get('title', '').strip(),
-                'url': result.get('url', ''),
-                'snippet': result.get('content', '').strip(),
-                'source': result.get('engine', 'unknown'),
-                'score': result.get('score', 0.0),
-                'published_date': result.get('published_date', None)
-            }
+            get = result.get
+            title = get('title', '').strip()
+            url = get('url', '')
             
             # Only include results with actual content
-            if processed_result['title'] and processed_result['url']:
-                processed.append(processed_result)
+            if title and url:
+                append({
+                    'title': title,
+                    'url': url,
+                    'snippet': get('content', '').strip(),
+                    'source': get('engine', 'unknown'),
+                    'score': float(get('score') or 0),
+                    'published_date': get('published_date', None)
+                })
         
-        # Sort by score if available
-        return sorted(
+        # Highest score first; ties keep their original order
+        return heapq.nlargest(
+            len(processed),
             processed,
-            key=lambda x: float(x['score'] or 0),
-            reverse=True
+            key=operator.itemgetter('score')
         )
 
-@click.command()
-@click.argument('query')
-@click.option('--num-results', '-n', default=5,
-              help='Number of results to return')
-@click.option('--timeout', '-t', default=30,
-              help='Search timeout in seconds')
-async def web_search_main(query: str, num_results: int, timeout: int) -> None:
-    """CLI command for web search."""
+async def web_search(query: str, num_results: int = 5,
+                     timeout: int = 30) -> List[Dict[str, Any]]:
+    """Run a single search and release the shared session afterwards.
+    
+    Args:
+        query: Search query string
+        num_results: Number of results to return
+        timeout: Request timeout in seconds
+        
+    Returns:
+        List of search results
+        
+    Raises:
+        SearchError: If search fails
+    """
     try:
         async with SearchService() as service:
-            results = await service.search(
+            return await service.search(
                 query,
                 num_results=num_results,
                 timeout=timeout
             )
-            
-            if not results:
-                click.echo("No results found.")
-                return
-            
-            for i, result in enumerate(results, 1):
-                click.echo(f"\n{i}. {result['title']}")
-                click.echo(f"URL: {result['url']}")
-                if result['published_date']:
-                    click.echo(f"Published: {result['published_date']}")
-                click.echo(f"Source: {result['source']}")
-                click.echo(f"\n{result['snippet']}\n")
-                click.echo("-" * 80)
-    except Exception as e:
-        logger.error("web_search_failed", error=str(e))
-        click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
-
-if __name__ == '__main__':
-    asyncio.run(web_search_main()) 
\ No newline at end of file
+    finally:
+        await close_shared_session()
\ No newline at end of file
@@ -1,46 +1,89 @@
 """Backup utilities for crs_thoughts data."""
 
+import os
 import shutil
+import tempfile
 from pathlib import Path
 from datetime import datetime
 import structlog
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 import zipfile
-import json
 
-from ..config.settings import ConfigManager
+from .._compat import dumps, loads
+from ..config.settings import get_config
 from ..exceptions import BackupError
 
 logger = structlog.get_logger(__name__)
 
+# Backup archives read in parallel when listing
+MAX_LIST_WORKERS = 8
+
+def _iter_files(root: str) -> Iterator[str]:
+    """Yield paths of regular files below a directory.
+    
+    Uses the file type reported by readdir, so no extra stat call is
+    made per entry. Symlinks are skipped.
+    
+    Args:
+        root: Directory to walk
+        
+    Yields:
+        Absolute path of each regular file
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
 class BackupService:
     """Service for managing backups of crs_thoughts data."""
     
     def __init__(self):
         """Initialize backup service."""
-        self.config = ConfigManager()
+        self.config = get_config()
         self.storage_dir = self.config.settings.storage_dir
         self.backup_dir = self.storage_dir / 'backups'
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
-    def create_backup(self, backup_name: Optional[str] = None) -> Path:
+    def create_backup(self, backup_name: Optional[str] = None,
+                      fast: bool = False) -> Path:
         """Create a backup of the current data.
         
         Args:
             backup_name: Optional name for the backup
                        (defaults to timestamp-based name)
+            fast: Store files uncompressed for a quick local snapshot
+                  (otherwise use the fastest DEFLATE level)
             
         Returns:
             Path to the created backup file
             
         Raises:
-            BackupError: If backup creation fails
+            BackupError: If backup creation fails or the backup already exists
         """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_name = backup_name or f"backup_{timestamp}"
         backup_file = self.backup_dir / f"{backup_name}.zip"
+        if backup_file.exists():
+            raise BackupError(f"Backup already exists: {backup_file}")
+        tmp_file: Optional[Path] = None
         
         try:
+            # Written under a unique temporary name and linked into place when
+            # complete, so an interrupted or concurrent backup never shows up
+            # as a .zip
+            fd, tmp_name = tempfile.mkstemp(prefix=f"{backup_name}.",
+                                            suffix='.zip.tmp',
+                                            dir=self.backup_dir)
+            os.close(fd)
+            tmp_file = Path(tmp_name)
+            
             # Create metadata
             metadata = {
                 'timestamp': timestamp,
@@ -55,10 +98,11 @@ class BackupService:
             }
             
             # Create zip archive
-            with zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-                # Add metadata
-                zf.writestr('metadata.json', json.dumps(metadata, indent=2))
-                
+            compression = zipfile.ZIP_STORED if fast else zipfile.ZIP_DEFLATED
+            compresslevel = None if fast else 1
+            with zipfile.ZipFile(tmp_file, 'w', compression,
+                                 compresslevel=compresslevel,
+                                 allowZip64=True) as zf:
                 # Add config file
                 config_file = self.storage_dir / 'config.yaml'
                 if config_file.exists():
@@ -68,21 +112,34 @@ class BackupService:
                 for dir_name in ['questions', 'answers', 'thoughts']:
                     dir_path = self.storage_dir / dir_name
                     if dir_path.exists():
-                        for file_path in dir_path.glob('**/*'):
-                            if file_path.is_file():
-                                zf.write(
-                                    file_path,
-                                    str(file_path.relative_to(self.storage_dir))
-                                )
+                        for abs_path in _iter_files(str(dir_path)):
+                            zf.write(
+                                abs_path,
+                                os.path.relpath(abs_path, self.storage_dir)
+                            )
+                
+                # Metadata goes last; its presence marks a complete archive
+                zf.writestr('metadata.json', dumps(metadata, indent=True))
+            # Unlike a rename, linking fails rather than replacing a backup
+            # that claimed the name while this one was written
+            try:
+                os.link(tmp_file, backup_file)
+            except FileExistsError:
+                raise BackupError(f"Backup already exists: {backup_file}") from None
             
             logger.info("backup_created",
                        backup_file=str(backup_file),
                        size=backup_file.stat().st_size)
             return backup_file
             
+        except BackupError:
+            raise
         except Exception as e:
             logger.error("backup_failed", error=str(e))
             raise BackupError(f"Failed to create backup: {str(e)}") from e
+        finally:
+            if tmp_file is not None:
+                tmp_file.unlink(missing_ok=True)
 
     def restore_backup(self, backup_path: Path) -> None:
         """Restore data from a backup file.
@@ -101,15 +158,19 @@ class BackupService:
             with zipfile.ZipFile(backup_path, 'r') as zf:
                 # Verify metadata
                 try:
-                    metadata = json.loads(zf.read('metadata.json'))
+                    metadata = loads(zf.read('metadata.json'))
                     logger.info("restoring_backup",
                               backup_name=metadata['name'],
                               timestamp=metadata['timestamp'])
                 except Exception as e:
                     raise BackupError("Invalid backup file: missing or invalid metadata")
                 
-                # Create backup of current data before restoring
-                current_backup = self.create_backup("pre_restore_backup")
+                # Create backup of current data before restoring; the name is
+                # unique so repeated restores never collide
+                current_backup = self.create_backup(
+                    f"pre_restore_backup_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
+                    fast=True
+                )
                 
                 # Clear existing data
                 for dir_name in ['questions', 'answers', 'thoughts']:
@@ -128,25 +189,47 @@ class BackupService:
             logger.error("restore_failed", error=str(e))
             raise BackupError(f"Failed to restore backup: {str(e)}") from e
 
+    def _read_backup_meta(self, backup_file: Path) -> Optional[dict]:
+        """Read the listing information for one backup file.
+        
+        Args:
+            backup_file: Path to the backup archive
+            
+        Returns:
+            Backup information dictionary, or None if the file is not a
+            valid backup
+        """
+        try:
+            with zipfile.ZipFile(backup_file, 'r') as zf:
+                metadata = loads(zf.read('metadata.json'))
+                return {
+                    'name': metadata['name'],
+                    'timestamp': metadata['timestamp'],
+                    'version': metadata.get('version', 'unknown'),
+                    'size': backup_file.stat().st_size,
+                    'path': str(backup_file)
+                }
+        except Exception:
+            logger.warning(f"Invalid backup file: {backup_file}")
+            return None
+
     def list_backups(self) -> list[dict]:
         """List available backups.
         
+        Archives are read concurrently since each open is disk-bound.
+        
         Returns:
-            List of backup information dictionaries
+            List of backup information dictionaries, newest first; backups
+            from the same second are ordered by name
         """
-        backups = []
-        for backup_file in self.backup_dir.glob('*.zip'):
-            try:
-                with zipfile.ZipFile(backup_file, 'r') as zf:
-                    metadata = json.loads(zf.read('metadata.json'))
-                    backups.append({
-                        'name': metadata['name'],
-                        'timestamp': metadata['timestamp'],
-                        'version': metadata.get('version', 'unknown'),
-                        'size': backup_file.stat().st_size,
-                        'path': str(backup_file)
-                    })
-            except Exception:
-                logger.warning(f"Invalid backup file: {backup_file}")
-                
-        return sorted(backups, key=lambda x: x['timestamp'], reverse=True) 
\ No newline at end of file
+        paths = list(self.backup_dir.glob('*.zip'))
+        if not paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_LIST_WORKERS, len(paths))) as executor:
+            backups = [info for info in executor.map(self._read_backup_meta, paths)
+                       if info is not None]
+        
+        # Timestamps only have one-second resolution, so the name breaks ties
+        # rather than the order the directory happens to be listed in
+        return sorted(backups, key=lambda x: (x['timestamp'], x['name']), reverse=True)
\ No newline at end of file
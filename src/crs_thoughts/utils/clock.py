@@ -0,0 +1,52 @@
+"""Clock used to timestamp entries."""
+
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+
+@dataclass
+class _Snapshot:
+    """Timestamp shared by every ``now()`` call within one tick."""
+    resolution_ns: int
+    value: Optional[datetime] = None
+    taken_ns: int = 0
+
+_snapshot: ContextVar[Optional[_Snapshot]] = ContextVar('clock_snapshot', default=None)
+
+def now() -> datetime:
+    """Get the current local time.
+    
+    Inside ``batched_clock`` this returns a cached timestamp that is only
+    refreshed once per resolution window; elsewhere it is ``datetime.now()``.
+    
+    Returns:
+        Current (possibly coarsened) local time
+    """
+    snapshot = _snapshot.get()
+    if snapshot is None:
+        return datetime.now()
+    tick = time.monotonic_ns()
+    if snapshot.value is None or tick - snapshot.taken_ns >= snapshot.resolution_ns:
+        snapshot.value = datetime.now()
+        snapshot.taken_ns = tick
+    return snapshot.value
+
+@contextlib.contextmanager
+def batched_clock(resolution_s: float = 0.01) -> Iterator[None]:
+    """Share timestamps between entries created close together.
+    
+    Meant for bulk imports and replays where many entries are created in
+    a tight loop; entries created within ``resolution_s`` of each other
+    get the same timestamp.
+    
+    Args:
+        resolution_s: Seconds a cached timestamp stays current
+    """
+    token = _snapshot.set(_Snapshot(resolution_ns=int(resolution_s * 1e9)))
+    try:
+        yield
+    finally:
+        _snapshot.reset(token)
@@ -4,6 +4,9 @@ import re
 import uuid
 from typing import Optional
 
+# Newlines become spaces to keep the CSV format clean; quotes are doubled
+_ESCAPE_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '"': '""'})
+
 def escape_content(content: str) -> str:
     """Escape special characters in content for CSV storage.
     
@@ -13,11 +16,20 @@ def escape_content(content: str) -> str:
     Returns:
         Escaped content string
     """
-    # Replace newlines with space to keep CSV format clean
-    content = content.replace('\n', ' ').replace('\r', ' ')
-    # Escape quotes
-    content = content.replace('"', '""')
-    return content
+    return content.translate(_ESCAPE_TABLE)
+
+def is_blank(content: str) -> bool:
+    """Check whether content is empty or whitespace only.
+    
+    Unlike ``not content.strip()`` this never copies the string.
+    
+    Args:
+        content: Content string to check
+        
+    Returns:
+        True if the content has no non-whitespace characters
+    """
+    return not content or content.isspace()
 
 def validate_uuid(uuid_str: Optional[str]) -> bool:
     """Validate UUID string format.
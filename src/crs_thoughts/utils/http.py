@@ -0,0 +1,92 @@
+"""Pooled HTTP client sessions shared across services."""
+
+import asyncio
+import atexit
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# aiohttp is heavy to import, so it is only loaded once a request is made
+_aiohttp: Any = None
+
+def import_aiohttp() -> Any:
+    """Import aiohttp on first use.
+    
+    Returns:
+        The aiohttp module
+    """
+    global _aiohttp
+    if _aiohttp is None:
+        import aiohttp
+        _aiohttp = aiohttp
+    return _aiohttp
+
+# Process-wide sessions keyed by pool name, each with the event loop it was
+# created in. TCP connections, TLS and DNS results are reused between requests.
+_SESSIONS: Dict[str, Tuple["aiohttp.ClientSession", asyncio.AbstractEventLoop]] = {}
+
+async def get_session(
+    pool: str,
+    limit: int = 100,
+    limit_per_host: int = 0,
+    keepalive_timeout: float = 15
+) -> "aiohttp.ClientSession":
+    """Get the shared client session for a pool, creating it on first use.
+    
+    A session is bound to the event loop it was created in, so a new one
+    is created whenever the running loop changes. The connector limits
+    only apply when the session is created.
+    
+    Args:
+        pool: Name of the pool, one per remote service
+        limit: Maximum number of open connections
+        limit_per_host: Maximum connections per host (0 for no limit)
+        keepalive_timeout: Seconds an idle connection is kept open
+    
+    Returns:
+        Shared aiohttp client session
+    """
+    aiohttp = import_aiohttp()
+    loop = asyncio.get_running_loop()
+    session, session_loop = _SESSIONS.get(pool, (None, None))
+    if session is None or session.closed or session_loop is not loop:
+        if session is not None and not session.closed:
+            # Owning loop is gone; drop the session without touching it
+            session.detach()
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=300
+            )
+        )
+        _SESSIONS[pool] = (session, loop)
+    return session
+
+async def close_shared_session() -> None:
+    """Close every shared client session that is open."""
+    loop = asyncio.get_running_loop()
+    sessions = list(_SESSIONS.values())
+    _SESSIONS.clear()
+    for session, session_loop in sessions:
+        if session.closed:
+            continue
+        if session_loop is loop:
+            await session.close()
+        else:
+            # Owning loop is gone; drop the session without touching it
+            session.detach()
+
+@atexit.register
+def _close_shared_sessions_at_exit() -> None:
+    """Release the shared sessions when the interpreter exits."""
+    while _SESSIONS:
+        _, (session, loop) = _SESSIONS.popitem()
+        if session.closed:
+            continue
+        if not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(session.close())
+        else:
+            session.detach()
\ No newline at end of file
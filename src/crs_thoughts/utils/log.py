@@ -0,0 +1,33 @@
+"""Structured logging helpers for crs_thoughts."""
+
+import uuid
+from typing import Any, MutableMapping
+
+import structlog
+
+def stringify_uuids(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Render UUID values as plain strings.
+    
+    Callers log ``UUID`` objects directly; the conversion happens here,
+    only for events that pass level filtering and actually get rendered.
+    
+    Args:
+        logger: Wrapped logger (unused)
+        method_name: Name of the log method called (unused)
+        event_dict: Event being processed
+        
+    Returns:
+        The event with UUID values converted to strings
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, uuid.UUID):
+            event_dict[key] = str(value)
+    return event_dict
+
+def configure_structlog() -> None:
+    """Install the crs_thoughts processors ahead of the configured chain."""
+    processors = structlog.get_config()['processors']
+    if stringify_uuids not in processors:
+        structlog.configure(processors=[stringify_uuids, *processors])
@@ -1,15 +1,51 @@
 """Storage utilities for managing entries."""
 
 import csv
+import functools
 import os
 from pathlib import Path
 from datetime import datetime
 import uuid
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, TextIO, Tuple, Union
 
+from .formatting import is_blank
 from ..models.entry import Question, Answer, Thought
 from ..exceptions import StorageError, ValidationError
 
+# Maximum number of entries kept in the tag cache; oldest are evicted first
+TAG_CACHE_MAX_ENTRIES = 10000
+
+# New tags are appended to the cache file, which is compacted once it holds
+# this many rows
+_TAG_CACHE_COMPACT_ROWS = 2 * TAG_CACHE_MAX_ENTRIES
+
+# Buffer size for the cached append handles
+_WRITER_BUFFER_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=1024)
+def _lookup_row(csv_file: Path, stamp: Tuple[int, int, int],
+                entry_uuid: str) -> Optional[Dict[str, str]]:
+    """Scan a CSV file for an entry, memoized on the file's stat stamp.
+    
+    The stamp changes whenever the file is appended to or replaced, so
+    stale rows are never served and no explicit invalidation is needed.
+    
+    Args:
+        csv_file: CSV file to search
+        stamp: Inode, size and modification time of the file
+        entry_uuid: UUID string of the entry
+        
+    Returns:
+        Row as a dictionary, or None if not found
+    """
+    with csv_file.open('r', newline='') as f:
+        for row in csv.DictReader(f):
+            if row['uuid'] == entry_uuid:
+                return row
+    return None
+
+
 class Storage:
     """Handles storage operations for entries."""
 
@@ -23,6 +59,12 @@ class Storage:
         self.questions_dir = self.base_dir / 'questions'
         self.answers_dir = self.base_dir / 'answers'
         self.thoughts_dir = self.base_dir / 'thoughts'
+        self.tag_cache_file = self.base_dir / 'tag_cache.csv'
+        self._tag_cache: Optional[Dict[str, List[str]]] = None
+        self._tag_cache_rows = 0
+        
+        # Append handles are opened on first write and reused, keyed by entry kind
+        self._writers: Dict[str, Tuple[TextIO, Any]] = {}
         
         self._initialize_directories()
 
@@ -51,6 +93,64 @@ class Storage:
                 writer = csv.writer(f)
                 writer.writerow(headers)
 
+    def _get_writer(self, key: str, path: Path) -> Any:
+        """Get the cached CSV writer for an entry file, opening it on first use.
+        
+        Args:
+            key: Entry kind the handle is cached under
+            path: CSV file to append to
+            
+        Returns:
+            CSV writer bound to the open file
+        """
+        cached = self._writers.get(key)
+        if cached is not None and not self._is_current(cached[0], path):
+            # The file was replaced or removed under us (e.g. by a restore)
+            self._close_writer(key)
+            cached = None
+        if cached is None:
+            fp = path.open('a', newline='', buffering=_WRITER_BUFFER_SIZE)
+            cached = self._writers[key] = (fp, csv.writer(fp))
+        return cached[1]
+
+    @staticmethod
+    def _is_current(fp: TextIO, path: Path) -> bool:
+        """Check that an open handle still refers to the file at path."""
+        try:
+            current = path.stat()
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(fp.fileno())
+        return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+    def _append_row(self, key: str, path: Path, row: List[str]) -> None:
+        """Append a row through the cached writer and flush it to disk.
+        
+        Args:
+            key: Entry kind the handle is cached under
+            path: CSV file to append to
+            row: Column values to write
+        """
+        self._get_writer(key, path).writerow(row)
+        self._writers[key][0].flush()
+
+    def _close_writer(self, key: str) -> None:
+        """Close the cached handle for an entry kind, if open."""
+        cached = self._writers.pop(key, None)
+        if cached is not None:
+            cached[0].close()
+
+    def close(self) -> None:
+        """Flush and close all cached append handles."""
+        for key in list(self._writers):
+            self._close_writer(key)
+
+    def __enter__(self) -> 'Storage':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def store_question(self, content: str, username: str, timestamp: datetime,
                       entry_uuid: uuid.UUID, session_uuid: Optional[uuid.UUID] = None) -> None:
         """Store a question entry.
@@ -66,7 +166,7 @@ class Storage:
             StorageError: If there's an error writing to storage
             ValidationError: If the input data is invalid
         """
-        if not content.strip():
+        if is_blank(content):
             raise ValidationError("Question content cannot be empty")
 
         question = Question(
@@ -78,16 +178,232 @@ class Storage:
         )
 
         try:
-            with (self.questions_dir / 'questions.csv').open('a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    str(question.uuid),
-                    question.timestamp.isoformat(),
-                    question.username,
-                    question.content,
-                    str(question.session_uuid) if question.session_uuid else ''
-                ])
+            self._append_row('questions', self.questions_dir / 'questions.csv', [
+                question.uuid_str,
+                question.timestamp.isoformat(),
+                question.username,
+                question.content,
+                str(question.session_uuid) if question.session_uuid else ''
+            ])
         except Exception as e:
+            self._close_writer('questions')
             raise StorageError(f"Failed to store question: {str(e)}") from e
 
+    def _find_row(self, csv_file: Path, entry_uuid: str) -> Optional[Dict[str, str]]:
+        """Find the CSV row for an entry.
+        
+        Args:
+            csv_file: CSV file to search
+            entry_uuid: UUID string of the entry
+            
+        Returns:
+            Row as a dictionary, or None if not found
+            
+        Raises:
+            StorageError: If there's an error reading storage
+        """
+        try:
+            st = csv_file.stat()
+            return _lookup_row(csv_file, (st.st_ino, st.st_size, st.st_mtime_ns), entry_uuid)
+        except Exception as e:
+            raise StorageError(f"Failed to read {csv_file.name}: {str(e)}") from e
+
+    @staticmethod
+    def _row_fields(row: Dict[str, str]) -> Dict[str, Any]:
+        """Convert the common columns of a stored row to model fields.
+        
+        Rows hold the string form of every column, so UUIDs and the
+        timestamp are parsed back to their native types.
+        
+        Args:
+            row: CSV row as a dictionary
+            
+        Returns:
+            Keyword arguments for the entry constructor
+        """
+        return {
+            'uuid': uuid.UUID(row['uuid']),
+            'timestamp': datetime.fromisoformat(row['timestamp']),
+            'username': row['username'],
+            'content': row['content'],
+            'session_uuid': uuid.UUID(row['session_uuid']) if row['session_uuid'] else None,
+        }
+
+    def _load_question(self, question_uuid: str) -> Optional[Question]:
+        """Read a question from storage."""
+        row = self._find_row(self.questions_dir / 'questions.csv', question_uuid)
+        if row is None:
+            return None
+        return Question(**self._row_fields(row))
+
+    def _load_thought(self, thought_uuid: str) -> Optional[Thought]:
+        """Read a thought from storage."""
+        row = self._find_row(self.thoughts_dir / 'thoughts.csv', thought_uuid)
+        if row is None:
+            return None
+        return Thought(
+            **self._row_fields(row),
+            tags=row['tags'].split(',') if row['tags'] else []
+        )
+
+    def get_question(self, question_uuid: uuid.UUID) -> Optional[Question]:
+        """Get a question by UUID.
+        
+        Args:
+            question_uuid: UUID of the question
+            
+        Returns:
+            The question, or None if not found
+            
+        Raises:
+            StorageError: If there's an error reading storage
+        """
+        return self._load_question(str(question_uuid))
+
+    def get_thought(self, thought_uuid: uuid.UUID) -> Optional[Thought]:
+        """Get a thought by UUID.
+        
+        Args:
+            thought_uuid: UUID of the thought
+            
+        Returns:
+            The thought, or None if not found
+            
+        Raises:
+            StorageError: If there's an error reading storage
+        """
+        return self._load_thought(str(thought_uuid))
+
+    def update_thought_tags(self, thought_uuid: uuid.UUID, tags: List[str]) -> None:
+        """Replace the tags of a stored thought.
+        
+        Args:
+            thought_uuid: UUID of the thought to update
+            tags: New list of tags
+            
+        Raises:
+            StorageError: If there's an error updating storage
+        """
+        self.update_thought_tags_bulk({thought_uuid: tags})
+
+    def update_thought_tags_bulk(self, tags_by_uuid: Dict[uuid.UUID, List[str]]) -> None:
+        """Replace the tags of several stored thoughts in one rewrite.
+        
+        Args:
+            tags_by_uuid: Mapping of thought UUID to its new list of tags
+            
+        Raises:
+            StorageError: If there's an error updating storage
+        """
+        if not tags_by_uuid:
+            return
+        
+        updates = {str(key): ','.join(tags) for key, tags in tags_by_uuid.items()}
+        csv_file = self.thoughts_dir / 'thoughts.csv'
+        tmp_file = csv_file.with_suffix('.csv.tmp')
+        # The file is replaced below, so a cached handle would point at the old copy
+        self._close_writer('thoughts')
+        
+        try:
+            with csv_file.open('r', newline='') as src, \
+                    tmp_file.open('w', newline='') as dst:
+                reader = csv.DictReader(src)
+                writer = csv.DictWriter(dst, fieldnames=reader.fieldnames)
+                writer.writeheader()
+                for row in reader:
+                    if row['uuid'] in updates:
+                        row['tags'] = updates[row['uuid']]
+                    writer.writerow(row)
+            os.replace(tmp_file, csv_file)
+        except Exception as e:
+            raise StorageError(f"Failed to update thought tags: {str(e)}") from e
+
+    def _load_tag_cache(self) -> Dict[str, List[str]]:
+        """Load the tag cache from disk on first use.
+        
+        Returns:
+            Mapping of content key to cached tags, oldest first
+        """
+        if self._tag_cache is None:
+            cache: Dict[str, List[str]] = {}
+            rows = 0
+            if self.tag_cache_file.exists():
+                with self.tag_cache_file.open('r', newline='') as f:
+                    for key, tags in csv.reader(f):
+                        # Later rows supersede earlier ones for the same key
+                        cache.pop(key, None)
+                        cache[key] = tags.split(',') if tags else []
+                        rows += 1
+            self._evict_tag_cache(cache)
+            self._tag_cache, self._tag_cache_rows = cache, rows
+        return self._tag_cache
+
+    @staticmethod
+    def _evict_tag_cache(cache: Dict[str, List[str]]) -> None:
+        """Drop the least recently used entries beyond the cache bound."""
+        while len(cache) > TAG_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+
+    def _compact_tag_cache(self) -> None:
+        """Rewrite the tag cache file with one row per live entry."""
+        tmp_file = self.tag_cache_file.with_suffix('.csv.tmp')
+        self._close_writer('tag_cache')
+        with tmp_file.open('w', newline='') as f:
+            writer = csv.writer(f)
+            for cached_key, cached_tags in self._tag_cache.items():
+                writer.writerow([cached_key, ','.join(cached_tags)])
+        os.replace(tmp_file, self.tag_cache_file)
+        self._tag_cache_rows = len(self._tag_cache)
+
+    def get_cached_tags(self, key: str) -> Optional[List[str]]:
+        """Get previously generated tags for a content key.
+        
+        Args:
+            key: Content hash identifying the analysed text
+            
+        Returns:
+            Cached list of tags, or None if not cached
+            
+        Raises:
+            StorageError: If the cache cannot be read
+        """
+        try:
+            cache = self._load_tag_cache()
+        except Exception as e:
+            raise StorageError(f"Failed to read tag cache: {str(e)}") from e
+        
+        tags = cache.pop(key, None)
+        if tags is not None:
+            # Re-insert to mark as most recently used
+            cache[key] = tags
+        return tags
+
+    def cache_tags(self, key: str, tags: List[str]) -> None:
+        """Store generated tags for a content key.
+        
+        The cache is bounded to TAG_CACHE_MAX_ENTRIES; least recently used
+        entries are evicted first. New entries are appended to the cache
+        file, which is only rewritten once it grows past twice that bound.
+        
+        Args:
+            key: Content hash identifying the analysed text
+            tags: Generated tags
+            
+        Raises:
+            StorageError: If the cache cannot be written
+        """
+        try:
+            cache = self._load_tag_cache()
+            cache.pop(key, None)
+            cache[key] = list(tags)
+            self._evict_tag_cache(cache)
+            
+            self._append_row('tag_cache', self.tag_cache_file, [key, ','.join(tags)])
+            self._tag_cache_rows += 1
+            if self._tag_cache_rows >= _TAG_CACHE_COMPACT_ROWS:
+                self._compact_tag_cache()
+        except Exception as e:
+            self._close_writer('tag_cache')
+            raise StorageError(f"Failed to write tag cache: {str(e)}") from e
+
     # Similar implementations for store_answer and store_thought... 
\ No newline at end of file
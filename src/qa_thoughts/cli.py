@@ -7,7 +7,6 @@ from datetime import datetime
 import uuid
 from typing import Optional
 
-from .commands import question, answer, thought
 from .utils.storage import Storage
 from .utils.formatting import escape_content, validate_uuid
 
@@ -26,6 +25,9 @@ def question_main() -> None:
     timestamp = datetime.now()
     entry_uuid = uuid.uuid4()
 
+    # Only the handler for this command is imported
+    from .commands import question
+
     try:
         question.handle_question(
             storage=storage,
@@ -54,6 +56,8 @@ def answer_main() -> None:
     timestamp = datetime.now()
     entry_uuid = uuid.uuid4()
 
+    from .commands import answer
+
     try:
         answer.handle_answer(
             storage=storage,
@@ -78,6 +82,8 @@ def thought_main() -> None:
     timestamp = datetime.now()
     entry_uuid = uuid.uuid4()
 
+    from .commands import thought
+
     try:
         thought.handle_thought(
             storage=storage,
@@ -17,23 +17,13 @@ class Entry:
 @dataclass
 class Question(Entry):
     """Question entry."""
-    
-    def __str__(self) -> str:
-        return f"{self.uuid},{self.timestamp.isoformat()},{self.username},{self.content}"
 
 @dataclass
 class Answer(Entry):
     """Answer entry with optional reference to a question."""
     
     question_uuid: Optional[uuid.UUID] = None
-    
-    def __str__(self) -> str:
-        quuid_str = str(self.question_uuid) if self.question_uuid else ""
-        return f"{self.uuid},{quuid_str},{self.timestamp.isoformat()},{self.username},{self.content}"
 
 @dataclass
 class Thought(Entry):
-    """Thought entry."""
-    
-    def __str__(self) -> str:
-        return f"{self.uuid},{self.timestamp.isoformat()},{self.username},{self.content}" 
\ No newline at end of file
+    """Thought entry."""
\ No newline at end of file
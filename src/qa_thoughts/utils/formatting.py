@@ -3,6 +3,11 @@
 import re
 from typing import Optional
 
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE
+)
+
 def escape_content(content: str) -> str:
     """Escape special characters in content string."""
     # Replace any existing quotes with escaped quotes
@@ -23,8 +28,4 @@ def validate_uuid(uuid_str: Optional[str]) -> bool:
     """Validate UUID format."""
     if not uuid_str:
         return False
-    uuid_pattern = re.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-        re.IGNORECASE
-    )
-    return bool(uuid_pattern.match(uuid_str)) 
\ No newline at end of file
+    return _UUID_RE.match(uuid_str) is not None
\ No newline at end of file
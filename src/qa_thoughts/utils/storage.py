@@ -4,7 +4,7 @@ import csv
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Set, Union
 
 from ..models.entry import Question, Answer, Thought
 
@@ -16,6 +16,8 @@ class Storage:
         if base_dir is None:
             base_dir = os.path.expanduser("~/.qa_thoughts")
         self.base_dir = Path(base_dir)
+        # Files already known to start with a header row
+        self._headers_written: Set[Path] = set()
         self._ensure_directories()
     
     def _ensure_directories(self) -> None:
@@ -29,17 +31,18 @@ class Storage:
         entry_type = entry.__class__.__name__.lower()
         file_path = self.base_dir / f"{entry_type}s" / f"{entry_type}s.csv"
         
-        # Create file with headers if it doesn't exist
-        if not file_path.exists():
-            headers = ['uuid', 'timestamp', 'username', 'content']
-            if isinstance(entry, Answer):
-                headers.insert(1, 'question_uuid')
-            
-            with open(file_path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
+        row = [str(entry.uuid), entry.timestamp.isoformat(), entry.username, entry.content]
+        if isinstance(entry, Answer):
+            row.insert(1, str(entry.question_uuid) if entry.question_uuid else '')
         
-        # Append entry
-        with open(file_path, 'a', newline='') as f:
+        # Append mode positions at the end, so an empty file needs headers
+        with open(file_path, 'a', newline='', buffering=1 << 16) as f:
             writer = csv.writer(f)
-            writer.writerow(str(entry).split(',')) 
\ No newline at end of file
+            if file_path not in self._headers_written and f.tell() == 0:
+                headers = ['uuid', 'timestamp', 'username', 'content']
+                if isinstance(entry, Answer):
+                    headers.insert(1, 'question_uuid')
+                writer.writerow(headers)
+            self._headers_written.add(file_path)
+            # csv handles quoting of commas in the content
+            writer.writerow(row)
\ No newline at end of file
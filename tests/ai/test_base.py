@@ -11,7 +11,7 @@ from crs_thoughts.exceptions import AIError
 @pytest.fixture
 def mock_config():
     """Mock configuration for AI service."""
-    with patch('crs_thoughts.ai.base.ConfigManager') as mock:
+    with patch('crs_thoughts.ai.base.get_config') as mock:
         mock.return_value.settings.ai.enabled = True
         mock.return_value.settings.ai.url = "http://test-url"
         mock.return_value.settings.ai.model = "test-model"
@@ -112,6 +112,12 @@ def test_format_prompt_empty_template(mock_config):
     with pytest.raises(AIError, match="Empty prompt template"):
         service.format_prompt("", question="What is Python?")
 
+def test_format_prompt_static_template(mock_config):
+    """Test templates without placeholders are returned unchanged."""
+    service = AIService()
+    template = "You are a helpful assistant."
+    assert service.format_prompt(template, question="Unused") is template
+
 def test_format_prompt_with_extra_vars(mock_config):
     """Test prompt formatting with extra variables."""
     service = AIService()
@@ -122,4 +128,17 @@ def test_format_prompt_with_extra_vars(mock_config):
         extra="Ignored"
     )
     assert result == "Question: What is Python?"
-    
\ No newline at end of file
+
+@pytest.mark.asyncio
+async def test_generate_completion_client_error_not_retried(mock_config, mock_session):
+    """Test completion generation does not retry client errors."""
+    mock_response = AsyncMock()
+    mock_response.status = 400
+    mock_response.text.return_value = "Bad Request"
+    mock_session.post.return_value.__aenter__.return_value = mock_response
+    
+    async with AIService() as service:
+        service.session = mock_session
+        with pytest.raises(AIError, match="AI request failed with status: 400"):
+            await service.generate_completion("Test prompt")
+    assert mock_session.post.call_count == 1
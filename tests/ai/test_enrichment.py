@@ -19,6 +19,7 @@ def mock_storage():
             content="Test thought content",
             username="test_user"
         )
+        storage_instance.get_cached_tags.return_value = None
         yield storage_instance
 
 @pytest.fixture
@@ -28,6 +29,13 @@ def mock_ai_response() -> Dict[str, Any]:
         'response': 'Key topics:\n1. Testing\n2. Python\nTags: testing, python, automation'
     }
 
+@pytest.fixture
+def mock_completion():
+    """Patch completion requests on the slotted service class."""
+    with patch.object(EnrichmentService, 'generate_completion',
+                      new_callable=AsyncMock) as mock:
+        yield mock
+
 @pytest.fixture
 async def enrichment_service(mock_storage):
     """Create enrichment service with mocked dependencies."""
@@ -38,11 +46,9 @@ async def enrichment_service(mock_storage):
         yield service
 
 @pytest.mark.asyncio
-async def test_enrich_thought_success(enrichment_service, mock_ai_response):
+async def test_enrich_thought_success(enrichment_service, mock_completion, mock_ai_response):
     """Test successful thought enrichment."""
-    enrichment_service.generate_completion = AsyncMock(
-        return_value=mock_ai_response['response']
-    )
+    mock_completion.return_value = mock_ai_response['response']
 
     result = await enrichment_service.enrich_thought(uuid.uuid4())
     
@@ -53,12 +59,10 @@ async def test_enrich_thought_success(enrichment_service, mock_ai_response):
     assert any('testing' in tag.lower() for tag in result['generated_tags'])
 
 @pytest.mark.asyncio
-async def test_enrich_thought_with_search(enrichment_service, mock_ai_response):
+async def test_enrich_thought_with_search(enrichment_service, mock_completion, mock_ai_response):
     """Test enrichment with search results."""
     enrichment_service.search_enabled = True
-    enrichment_service.generate_completion = AsyncMock(
-        return_value=mock_ai_response['response']
-    )
+    mock_completion.return_value = mock_ai_response['response']
     
     # Mock search results
     mock_search_results = [{'title': 'Test Result', 'url': 'http://test.com'}]
@@ -82,13 +86,61 @@ async def test_enrich_nonexistent_thought(enrichment_service):
         await enrichment_service.enrich_thought(uuid.uuid4())
 
 @pytest.mark.asyncio
-async def test_enrich_thought_ai_error(mock_storage):
+async def test_enrich_thought_ai_error(mock_storage, mock_completion):
     """Test enrichment with AI error."""
     service = EnrichmentService()
     service.storage = mock_storage
-    service.generate_completion = AsyncMock(
-        side_effect=AIError("AI failed")
-    )
+    mock_completion.side_effect = AIError("AI failed")
     
     with pytest.raises(AIError, match="Failed to enrich thought"):
-        await service.enrich_thought(uuid.uuid4()) 
\ No newline at end of file
+        await service.enrich_thought(uuid.uuid4())
+
+@pytest.mark.asyncio
+async def test_enrich_thoughts_batch(enrichment_service, mock_completion, mock_ai_response):
+    """Test enriching several thoughts with a single storage update."""
+    mock_completion.return_value = mock_ai_response['response']
+    thought_uuids = [uuid.uuid4() for _ in range(3)]
+    
+    results = await enrichment_service.enrich_thoughts_batch(thought_uuids)
+    
+    assert list(results) == thought_uuids
+    assert mock_completion.await_count == 3
+    enrichment_service.storage.update_thought_tags_bulk.assert_called_once()
+    updated = enrichment_service.storage.update_thought_tags_bulk.call_args[0][0]
+    assert set(updated) == set(thought_uuids)
+
+@pytest.mark.asyncio
+async def test_enrich_thoughts_batch_keeps_successes(enrichment_service, mock_completion,
+                                                    mock_ai_response):
+    """Test failed thoughts are reported per UUID while the rest are saved."""
+    mock_completion.side_effect = [mock_ai_response['response'], AIError("AI failed")]
+    found, failed, missing = (uuid.uuid4() for _ in range(3))
+    thought = enrichment_service.storage.get_thought.return_value
+    enrichment_service.storage.get_thought.side_effect = (
+        lambda thought_uuid: None if thought_uuid == missing else thought
+    )
+    
+    results = await enrichment_service.enrich_thoughts_batch(
+        [found, failed, missing], concurrency=1
+    )
+    
+    assert 'generated_tags' in results[found]
+    assert isinstance(results[failed], AIError)
+    assert isinstance(results[missing], ValidationError)
+    updated = enrichment_service.storage.update_thought_tags_bulk.call_args[0][0]
+    assert set(updated) == {found}
+
+@pytest.mark.asyncio
+async def test_extract_tags_uses_cache(enrichment_service, mock_completion):
+    """Test cached tags skip the AI request."""
+    enrichment_service.storage.get_cached_tags.return_value = ['python', 'testing']
+    
+    tags = await enrichment_service._extract_tags("Test thought content")
+    
+    assert tags == {'python', 'testing'}
+    mock_completion.assert_not_called()
+
+def test_enrichment_service_uses_slots(enrichment_service):
+    """Test unknown attributes cannot be assigned by mistake."""
+    with pytest.raises(AttributeError):
+        enrichment_service.serach_enabled = True
\ No newline at end of file
@@ -13,7 +13,6 @@ import logging
 
 from crs_thoughts.ai.base import AIService
 from crs_thoughts.exceptions import AIError
-from crs_thoughts.config.settings import ConfigManager
 
 logger = structlog.get_logger(__name__)
 
@@ -22,7 +21,7 @@ OLLAMA_URL = "http://localhost:11434"
 @pytest.fixture
 async def mock_config():
     """Mock configuration for AI service."""
-    with patch('crs_thoughts.ai.base.ConfigManager') as mock:
+    with patch('crs_thoughts.ai.base.get_config') as mock:
         mock.return_value.settings.ai.enabled = True
         mock.return_value.settings.ai.url = OLLAMA_URL
         mock.return_value.settings.ai.model = "llama3.2:latest"
@@ -83,7 +82,7 @@ async def test_basic_completion():
 async def test_error_handling():
     """Test error handling in AIService."""
     async with AIService() as service:
-        service.ai_config.enabled = False
+        service.ai_config = service.ai_config.model_copy(update={'enabled': False})
         with pytest.raises(AIError):
             await service.generate_completion("")
 
@@ -0,0 +1,42 @@
+"""Tests for entry command handlers."""
+
+import pytest
+import uuid
+from datetime import datetime
+
+from crs_thoughts.commands.answer import handle_answer
+from crs_thoughts.commands.question import handle_question
+from crs_thoughts.commands.thought import handle_thought
+from crs_thoughts.exceptions import ValidationError, StorageError
+
+def test_handlers_store_entries(mock_storage):
+    """Test each handler calls its storage method with typed fields."""
+    entry_uuid = uuid.uuid4()
+    question_uuid = uuid.uuid4()
+    timestamp = datetime.now()
+    
+    handle_question(mock_storage, "Why?", "test_user", timestamp, entry_uuid)
+    handle_answer(mock_storage, "Because", "test_user", timestamp, entry_uuid,
+                  question_uuid=str(question_uuid))
+    handle_thought(mock_storage, "Hmm", "test_user", timestamp, entry_uuid)
+    
+    mock_storage.store_question.assert_called_once_with(
+        content="Why?", username="test_user", timestamp=timestamp,
+        entry_uuid=entry_uuid, session_uuid=None
+    )
+    assert mock_storage.store_answer.call_args.kwargs['question_uuid'] == question_uuid
+    assert mock_storage.store_thought.call_args.kwargs['tags'] == []
+
+def test_handler_errors(mock_storage):
+    """Test validation and storage failures are reported per kind."""
+    timestamp = datetime.now()
+    
+    with pytest.raises(ValidationError, match="Thought content cannot be empty"):
+        handle_thought(mock_storage, "  ", "test_user", timestamp, uuid.uuid4())
+    with pytest.raises(ValidationError, match="Invalid question UUID"):
+        handle_answer(mock_storage, "Because", "test_user", timestamp, uuid.uuid4(),
+                      question_uuid="not-a-uuid")
+    
+    mock_storage.store_question.side_effect = OSError("disk full")
+    with pytest.raises(StorageError, match="Failed to store question: disk full"):
+        handle_question(mock_storage, "Why?", "test_user", timestamp, uuid.uuid4())
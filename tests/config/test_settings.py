@@ -0,0 +1,79 @@
+"""Tests for configuration management."""
+
+import pytest
+import yaml
+from pathlib import Path
+
+from pydantic import ValidationError as PydanticValidationError
+
+from crs_thoughts.config.settings import ConfigManager, Settings, CONFIG_SCHEMA_VERSION
+from crs_thoughts.exceptions import ConfigurationError
+
+@pytest.fixture
+def config_home(tmp_path, monkeypatch) -> Path:
+    """Point the configuration directory at a temporary home."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path / '.crs_thoughts'
+
+def test_default_config_round_trip(config_home):
+    """Test a saved configuration loads back with the same values."""
+    created = ConfigManager().settings
+    data = yaml.safe_load((config_home / 'config.yaml').read_text())
+    assert data['schema_version'] == CONFIG_SCHEMA_VERSION
+    
+    loaded = ConfigManager().settings
+    assert loaded == created
+    assert isinstance(loaded.storage_dir, Path)
+
+def test_legacy_config_is_validated(config_home):
+    """Test files without the schema marker go through validation."""
+    config_home.mkdir()
+    (config_home / 'config.yaml').write_text("ai:\n  enabled: 'nah'\n")
+    
+    with pytest.raises(ConfigurationError, match="Failed to load configuration"):
+        ConfigManager()
+
+def test_edited_config_is_validated(config_home):
+    """Test files edited after saving are validated despite the schema marker."""
+    ConfigManager()
+    config_file = config_home / 'config.yaml'
+    data = yaml.safe_load(config_file.read_text())
+    data['ai']['enabled'] = 'nah'
+    config_file.write_text(yaml.safe_dump(data))
+    
+    with pytest.raises(ConfigurationError, match="Failed to load configuration"):
+        ConfigManager()
+
+def test_set_setting_validates_value(config_home):
+    """Test invalid values are rejected and not persisted."""
+    manager = ConfigManager()
+    
+    with pytest.raises(ConfigurationError, match="Failed to update setting"):
+        manager.set_setting('ai', {'enabled': 'nah'})
+    with pytest.raises(ConfigurationError, match="Unknown setting"):
+        manager.set_setting('bogus', 1)
+    
+    manager.set_setting('username', 'tester')
+    assert ConfigManager().settings.username == 'tester'
+
+def test_unchanged_config_is_parsed_once(config_home):
+    """Test managers share settings until the file changes on disk."""
+    first = ConfigManager().settings
+    assert ConfigManager().settings is first
+    
+    config_file = config_home / 'config.yaml'
+    data = yaml.safe_load(config_file.read_text())
+    data['username'] = 'someone_else'
+    config_file.write_text(yaml.safe_dump(data))
+    
+    reloaded = ConfigManager().settings
+    assert reloaded is not first
+    assert reloaded.username == 'someone_else'
+
+def test_default_sub_settings_are_shared_and_frozen():
+    """Test default AI settings are one immutable instance."""
+    first, second = Settings(), Settings()
+    assert first.ai is second.ai
+    
+    with pytest.raises(PydanticValidationError):
+        first.ai.enabled = False
@@ -1,16 +1,64 @@
 """Test fixtures for crs_thoughts."""
 
 import os
+import shutil
+import sys
 import tempfile
 from pathlib import Path
 import pytest
 from datetime import datetime
 import uuid
-from typing import Generator, Any
+from types import MappingProxyType
+from typing import Generator, Any, Mapping, Optional
 from unittest.mock import Mock, MagicMock, AsyncMock
 
 from crs_thoughts.utils.storage import Storage
 from crs_thoughts.models.entry import Question, Answer, Thought
+from crs_thoughts.config.settings import get_config
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config: pytest.Config) -> None:
+    """Run the suite across all cores when CI_PARALLEL=1 and xdist is installed.
+    
+    Tests only share state through session or module fixtures that each
+    xdist worker builds for itself, so they can be distributed freely.
+    """
+    if os.environ.get('CI_PARALLEL') != '1':
+        return
+    if not config.pluginmanager.hasplugin('xdist'):
+        return
+    if not config.getoption('numprocesses', None):
+        config.option.numprocesses = 'auto'
+
+# Base directory for tmp_path, set by pytest_configure when a ramdisk is used
+_RAMDISK_BASETEMP: Optional[Path] = None
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep temporary test files on /dev/shm when available.
+    
+    Backup and storage tests create and zip many small files; a RAM-backed
+    base directory avoids disk metadata and sync costs. An explicit
+    ``--basetemp`` is left alone, as is the per-worker one xdist passes on.
+    """
+    global _RAMDISK_BASETEMP
+    if config.option.basetemp is not None:
+        return
+    if not sys.platform.startswith('linux') or not os.path.isdir('/dev/shm'):
+        return
+    _RAMDISK_BASETEMP = Path('/dev/shm') / f'pytest-{os.getpid()}'
+    config.option.basetemp = str(_RAMDISK_BASETEMP)
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the ramdisk base directory, which is not cleaned up by pytest."""
+    if _RAMDISK_BASETEMP is not None:
+        shutil.rmtree(_RAMDISK_BASETEMP, ignore_errors=True)
+
+@pytest.fixture(autouse=True)
+def reset_config_cache() -> Generator[None, Any, None]:
+    """Reload configuration for every test."""
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
 
 @pytest.fixture
 def temp_storage_dir() -> Generator[Path, Any, None]:
@@ -40,19 +88,24 @@ def mock_storage():
     storage.get_thought = Mock()
     return storage
 
-@pytest.fixture
-def sample_entry_data() -> dict:
-    """Create sample entry data for tests."""
-    return {
+@pytest.fixture(scope="session")
+def sample_entry_data() -> Mapping[str, Any]:
+    """Sample entry data shared by all tests; read-only."""
+    return MappingProxyType({
         'content': 'Test content',
         'username': 'test_user',
-        'timestamp': datetime.now(),
-        'entry_uuid': uuid.uuid4(),
+        'timestamp': datetime(2024, 1, 1),
+        'entry_uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
         'session_uuid': None
-    }
+    })
+
+@pytest.fixture
+def fresh_uuid() -> uuid.UUID:
+    """A new random UUID for tests that must not reuse the sample one."""
+    return uuid.uuid4()
 
 @pytest.fixture
-def sample_models(sample_entry_data: dict) -> dict:
+def sample_models(sample_entry_data: Mapping[str, Any]) -> dict:
     """Create sample model instances."""
     return {
         'question': Question(
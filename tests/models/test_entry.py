@@ -0,0 +1,45 @@
+"""Tests for entry models."""
+
+import uuid
+from datetime import datetime
+
+from crs_thoughts.models.entry import Answer, Thought
+
+def test_entry_defaults():
+    """Test generated fields and the id alias."""
+    thought = Thought(username="test_user", content="Test thought")
+    
+    assert isinstance(thought.uuid, uuid.UUID)
+    assert thought.id == thought.uuid
+    assert isinstance(thought.timestamp, datetime)
+    assert thought.session_uuid is None
+    assert thought.tags == []
+
+def test_entry_to_dict():
+    """Test entries serialize UUIDs and timestamps as strings."""
+    entry_uuid = uuid.uuid4()
+    question_uuid = uuid.uuid4()
+    timestamp = datetime(2024, 1, 2, 3, 4, 5)
+    answer = Answer(
+        uuid=entry_uuid,
+        timestamp=timestamp,
+        username="test_user",
+        content="Test answer",
+        question_uuid=question_uuid
+    )
+    
+    assert answer.to_dict() == {
+        'username': 'test_user',
+        'content': 'Test answer',
+        'uuid': str(entry_uuid),
+        'timestamp': '2024-01-02T03:04:05',
+        'session_uuid': None,
+        'question_uuid': str(question_uuid),
+    }
+
+def test_entry_uuid_str():
+    """Test the UUID string is formatted once and reused."""
+    thought = Thought(username="test_user", content="Test thought")
+    
+    assert thought.uuid_str == str(thought.uuid)
+    assert thought.uuid_str is thought.uuid_str
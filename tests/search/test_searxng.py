@@ -8,13 +8,13 @@ import json
 from datetime import datetime
 import asyncio
 
-from crs_thoughts.search.searxng import SearchService
+from crs_thoughts.search.searxng import SearchService, close_shared_session
 from crs_thoughts.exceptions import SearchError
 
 @pytest.fixture
 def mock_config():
     """Mock configuration for search service."""
-    with patch('crs_thoughts.search.searxng.ConfigManager') as mock:
+    with patch('crs_thoughts.search.searxng.get_config') as mock:
         mock.return_value.settings.search.enabled = True
         mock.return_value.settings.search.url = "http://test-searx"
         yield mock
@@ -169,4 +169,33 @@ async def test_search_with_custom_params(mock_config, mock_session):
         call_args = mock_session.get.call_args
         params = call_args[1]['params']
         assert params['num_results'] == 10
-        assert call_args[1]['timeout'] == 60
\ No newline at end of file
+        assert call_args[1]['timeout'] == 60
+
+@pytest.mark.asyncio
+async def test_services_share_session(mock_config):
+    """Test search services reuse one pooled session."""
+    try:
+        async with SearchService() as first:
+            session = first.session
+        async with SearchService() as second:
+            assert second.session is session
+        assert not session.closed
+    finally:
+        await close_shared_session()
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_search_many(mock_config):
+    """Test concurrent searches keep query order and report failures."""
+    async def fake_search(query, num_results=5, timeout=30):
+        if query == "bad":
+            raise SearchError("Search failed with status: 500")
+        return [{'title': query}]
+    
+    async with SearchService() as service:
+        with patch.object(SearchService, 'search', side_effect=fake_search):
+            results = await service.search_many(["one", "bad", "two"], concurrency=2)
+    
+    assert results[0] == [{'title': 'one'}]
+    assert isinstance(results[1], SearchError)
+    assert results[2] == [{'title': 'two'}]
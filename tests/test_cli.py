@@ -1,14 +1,14 @@
 """Tests for CLI functionality."""
 
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, AsyncMock
 import uuid
 from datetime import datetime
 import sys
 
 from crs_thoughts.cli import (
     get_current_username, handle_error,
-    question_main, answer_main, thought_main
+    question_main, answer_main, thought_main, web_search_main
 )
 from crs_thoughts.exceptions import ValidationError, StorageError
 from crs_thoughts.utils.storage import Storage
@@ -117,4 +117,18 @@ def test_thought_main_with_long_content(mock_storage, mock_handlers):
             mock_handlers['thought'].assert_called_once()
             args = mock_handlers['thought'].call_args[1]
             assert args['content'] == long_content
-            assert args['storage'] == mock_storage
\ No newline at end of file
+            assert args['storage'] == mock_storage
+
+def test_web_search_main(capsys):
+    """Test the web-search command prints each result."""
+    result = {'title': 'Test', 'url': 'http://test.com', 'published_date': None,
+              'source': 'engine', 'snippet': 'snippet text'}
+    with patch('crs_thoughts.search.searxng.web_search',
+               new_callable=AsyncMock, return_value=[result]) as mock_search:
+        web_search_main(['test query', '-n', '3'])
+    
+    mock_search.assert_awaited_once_with('test query', 3, 30)
+    out = capsys.readouterr().out
+    assert '1. Test' in out
+    assert 'URL: http://test.com' in out
+    assert 'Published' not in out
\ No newline at end of file
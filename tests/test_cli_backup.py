@@ -1,5 +1,6 @@
 """Tests for CLI backup functionality."""
 
+import re
 import pytest
 from pathlib import Path
 from unittest.mock import patch, Mock, ANY
@@ -8,18 +9,26 @@ import json
 from crs_thoughts.cli import backup_main
 from crs_thoughts.exceptions import BackupError
 
+@pytest.fixture(scope="module")
+def _backup_service_patcher():
+    """Patch the CLI's BackupService once for every test in this module."""
+    patcher = patch('crs_thoughts.cli.BackupService')
+    mock_cls = patcher.start()
+    yield mock_cls
+    patcher.stop()
+
 @pytest.fixture
-def mock_backup_service():
-    """Mock backup service."""
-    with patch('crs_thoughts.cli.BackupService') as mock:
-        yield mock.return_value
+def mock_backup_service(_backup_service_patcher):
+    """Mock backup service, reset for each test."""
+    _backup_service_patcher.reset_mock()
+    _backup_service_patcher.return_value.reset_mock(return_value=True, side_effect=True)
+    yield _backup_service_patcher.return_value
 
 def test_backup_create(mock_backup_service, capsys):
     """Test backup create command."""
     mock_backup_service.create_backup.return_value = Path('/test/backup.zip')
     
-    with patch('sys.argv', ['crsbackup', 'create']):
-        backup_main()
+    backup_main(['create'])
         
     captured = capsys.readouterr()
     assert "Backup created: /test/backup.zip" in captured.out
@@ -29,8 +38,7 @@ def test_backup_create_with_name(mock_backup_service, capsys):
     """Test backup create command with custom name."""
     mock_backup_service.create_backup.return_value = Path('/test/custom_backup.zip')
     
-    with patch('sys.argv', ['crsbackup', 'create', '--name', 'custom_backup']):
-        backup_main()
+    backup_main(['create', '--name', 'custom_backup'])
         
     captured = capsys.readouterr()
     assert "Backup created: /test/custom_backup.zip" in captured.out
@@ -40,8 +48,7 @@ def test_backup_list_empty(mock_backup_service, capsys):
     """Test backup list command with no backups."""
     mock_backup_service.list_backups.return_value = []
     
-    with patch('sys.argv', ['crsbackup', 'list']):
-        backup_main()
+    backup_main(['list'])
         
     captured = capsys.readouterr()
     assert "No backups found" in captured.out
@@ -59,18 +66,16 @@ def test_backup_list(mock_backup_service, capsys):
     ]
     mock_backup_service.list_backups.return_value = mock_backups
     
-    with patch('sys.argv', ['crsbackup', 'list']):
-        backup_main()
+    backup_main(['list'])
         
-    captured = capsys.readouterr()
-    assert "backup1" in captured.out
-    assert "1.00 MB" in captured.out
-    assert "0.1.0" in captured.out
+    out = capsys.readouterr().out
+    assert "backup1" in out
+    assert "1.00 MB" in out
+    assert "0.1.0" in out
 
 def test_backup_restore(mock_backup_service, capsys):
     """Test backup restore command."""
-    with patch('sys.argv', ['crsbackup', 'restore', 'backup1']):
-        backup_main()
+    backup_main(['restore', 'backup1'])
         
     captured = capsys.readouterr()
     assert "Backup restored successfully" in captured.out
@@ -80,17 +85,15 @@ def test_backup_error_handling(mock_backup_service, capsys):
     """Test error handling in backup commands."""
     mock_backup_service.create_backup.side_effect = BackupError("Test error")
     
-    with patch('sys.argv', ['crsbackup', 'create']):
-        with pytest.raises(SystemExit):
-            backup_main()
-        
+    with pytest.raises(SystemExit):
+        backup_main(['create'])
+    
     captured = capsys.readouterr()
     assert "Error: Test error" in captured.err
 
 def test_backup_invalid_command(capsys):
     """Test invalid backup command."""
-    with patch('sys.argv', ['crsbackup']):
-        backup_main()
+    backup_main([])
         
     captured = capsys.readouterr()
     assert "usage:" in captured.out  # Help message should be displayed 
@@ -100,8 +103,7 @@ def test_backup_create_with_long_name(mock_backup_service, capsys):
     long_name = "a" * 100
     mock_backup_service.create_backup.return_value = Path(f'/test/{long_name}.zip')
     
-    with patch('sys.argv', ['crsbackup', 'create', '--name', long_name]):
-        backup_main()
+    backup_main(['create', '--name', long_name])
         
     captured = capsys.readouterr()
     assert long_name in captured.out
@@ -118,39 +120,35 @@ def test_backup_list_with_multiple_backups(mock_backup_service, capsys):
     ]
     mock_backup_service.list_backups.return_value = mock_backups
     
-    with patch('sys.argv', ['crsbackup', 'list']):
-        backup_main()
+    backup_main(['list'])
         
-    captured = capsys.readouterr()
-    for i in range(1, 4):
-        assert f'backup{i}' in captured.out
-        assert f'{i}.00 MB' in captured.out
+    out = capsys.readouterr().out
+    pattern = re.compile(r'Name: backup(\d).*?Size: (\d)\.00 MB', re.DOTALL)
+    found = {match.groups() for match in pattern.finditer(out)}
+    assert found == {('1', '1'), ('2', '2'), ('3', '3')}
 
-def test_backup_restore_with_absolute_path(mock_backup_service, capsys, tmp_path):
+def test_backup_restore_with_absolute_path(mock_backup_service, tmp_path):
     """Test backup restore command with absolute path."""
     backup_path = tmp_path / 'test_backup.zip'
     
-    with patch('sys.argv', ['crsbackup', 'restore', str(backup_path)]):
-        backup_main()
+    backup_main(['restore', str(backup_path)])
         
     mock_backup_service.restore_backup.assert_called_once_with(backup_path)
 
 def test_backup_command_with_no_args(capsys):
     """Test backup command with no arguments."""
-    with patch('sys.argv', ['crsbackup']):
-        backup_main()
+    backup_main([])
         
-    captured = capsys.readouterr()
-    assert 'usage:' in captured.out
-    assert 'Backup commands' in captured.out
+    out = capsys.readouterr().out
+    assert 'usage:' in out
+    assert 'Backup commands' in out
 
 def test_backup_error_handling_with_keyboard_interrupt(mock_backup_service, capsys):
     """Test backup error handling with KeyboardInterrupt."""
     mock_backup_service.create_backup.side_effect = KeyboardInterrupt()
     
     with pytest.raises(SystemExit):
-        with patch('sys.argv', ['crsbackup', 'create']):
-            backup_main()
+        backup_main(['create'])
     
     captured = capsys.readouterr()
     assert "Error: " in captured.err
\ No newline at end of file
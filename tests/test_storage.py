@@ -3,18 +3,21 @@
 import pytest
 from pathlib import Path
 import csv
+import os
 from datetime import datetime
 import uuid
 from typing import Dict, Any
+from unittest.mock import patch
 
+from crs_thoughts.utils import storage as storage_module
 from crs_thoughts.utils.storage import Storage
 from crs_thoughts.exceptions import StorageError, ValidationError
 from crs_thoughts.models.entry import Question, Answer, Thought
 
-@pytest.fixture
-def storage_with_data(temp_storage_dir: Path, sample_entry_data: Dict[str, Any]) -> Storage:
-    """Create storage with test data."""
-    storage = Storage()
+@pytest.fixture(scope="module")
+def storage_with_data(tmp_path_factory, sample_entry_data: Dict[str, Any]) -> Storage:
+    """Create storage with test data, shared by the read-only tests in this module."""
+    storage = Storage(str(tmp_path_factory.mktemp('storage')))
     
     # Create test entries
     storage.store_question(**sample_entry_data)
@@ -47,6 +50,37 @@ def test_store_question(storage: Storage, sample_entry_data: Dict[str, Any]):
         assert row['content'] == sample_entry_data['content']
         assert row['username'] == sample_entry_data['username']
 
+def test_store_question_reuses_handle(tmp_path: Path, sample_entry_data: Dict[str, Any],
+                                      fresh_uuid: uuid.UUID):
+    """Test consecutive questions are appended through one open handle."""
+    storage = Storage(str(tmp_path))
+    storage.store_question(**sample_entry_data)
+    fp = storage._writers['questions'][0]
+    storage.store_question(**{**sample_entry_data, 'entry_uuid': fresh_uuid})
+    
+    assert storage._writers['questions'][0] is fp
+    with (storage.questions_dir / 'questions.csv').open() as f:
+        assert len(list(csv.DictReader(f))) == 2
+    
+    storage.close()
+    assert fp.closed
+
+def test_store_question_reopens_replaced_file(tmp_path: Path, sample_entry_data: Dict[str, Any],
+                                              fresh_uuid: uuid.UUID):
+    """Test appends follow the file after it is replaced on disk."""
+    with Storage(str(tmp_path)) as storage:
+        storage.store_question(**sample_entry_data)
+        csv_file = storage.questions_dir / 'questions.csv'
+        copy = csv_file.with_suffix('.csv.copy')
+        copy.write_bytes(csv_file.read_bytes())
+        os.replace(copy, csv_file)
+        
+        storage.store_question(**{**sample_entry_data, 'entry_uuid': fresh_uuid})
+        
+        assert storage.get_question(fresh_uuid) is not None
+    with csv_file.open() as f:
+        assert len(list(csv.DictReader(f))) == 2
+
 def test_store_answer(storage: Storage, sample_entry_data: Dict[str, Any]):
     """Test storing an answer."""
     storage.store_answer(**sample_entry_data)
@@ -88,10 +122,45 @@ def test_get_nonexistent_question(storage: Storage):
     result = storage.get_question(uuid.uuid4())
     assert result is None
 
+def test_get_thought_from_stored_row(storage: Storage):
+    """Test a stored thought row is converted back to typed fields."""
+    thought_uuid = uuid.uuid4()
+    session_uuid = uuid.uuid4()
+    timestamp = datetime(2024, 1, 2, 3, 4, 5)
+    with (storage.thoughts_dir / 'thoughts.csv').open('a', newline='') as f:
+        csv.writer(f).writerow([
+            str(thought_uuid), timestamp.isoformat(), 'test_user',
+            'Stored thought', str(session_uuid), 'python,testing'
+        ])
+    
+    thought = storage.get_thought(thought_uuid)
+    
+    assert thought.id == thought_uuid
+    assert thought.timestamp == timestamp
+    assert thought.session_uuid == session_uuid
+    assert thought.tags == ['python', 'testing']
+
 def test_storage_error_handling(storage: Storage, sample_entry_data: Dict[str, Any]):
     """Test storage error handling."""
-    # Make directory read-only
-    storage.questions_dir.chmod(0o444)
+    # Simulate a read-only directory without changing real permissions
+    with patch.object(Path, 'open', side_effect=PermissionError('read-only')):
+        with pytest.raises(StorageError):
+            storage.store_question(**sample_entry_data)
+
+def test_tag_cache_appends_and_compacts(tmp_path: Path, monkeypatch):
+    """Test cached tags are appended and the file is compacted past its bound."""
+    monkeypatch.setattr(storage_module, 'TAG_CACHE_MAX_ENTRIES', 2)
+    monkeypatch.setattr(storage_module, '_TAG_CACHE_COMPACT_ROWS', 4)
+    with Storage(str(tmp_path)) as storage:
+        storage.cache_tags('a', ['one'])
+        storage.cache_tags('b', ['two'])
+        storage.cache_tags('a', ['three'])
+        assert len(storage.tag_cache_file.read_text().splitlines()) == 3
+        
+        storage.cache_tags('c', ['four'])
+        assert len(storage.tag_cache_file.read_text().splitlines()) == 2
     
-    with pytest.raises(StorageError):
-        storage.store_question(**sample_entry_data)
\ No newline at end of file
+    reloaded = Storage(str(tmp_path))
+    assert reloaded.get_cached_tags('a') == ['three']
+    assert reloaded.get_cached_tags('b') is None
+    assert reloaded.get_cached_tags('c') == ['four']
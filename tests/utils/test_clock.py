@@ -0,0 +1,26 @@
+"""Tests for the entry clock."""
+
+from crs_thoughts.models.entry import Thought
+from crs_thoughts.utils import clock
+
+def test_now_outside_batch_is_live():
+    """Test every call reads the system clock by default."""
+    assert clock.now() <= clock.now()
+    assert clock._snapshot.get() is None
+
+def test_batched_clock_reuses_timestamp():
+    """Test entries created within one tick share a timestamp."""
+    with clock.batched_clock(resolution_s=60):
+        first = Thought(username="test_user", content="One")
+        second = Thought(username="test_user", content="Two")
+    
+    assert first.timestamp is second.timestamp
+    assert clock._snapshot.get() is None
+
+def test_batched_clock_refreshes_after_resolution():
+    """Test a zero resolution never reuses a timestamp."""
+    with clock.batched_clock(resolution_s=0):
+        first = clock.now()
+        second = clock.now()
+    
+    assert first is not second
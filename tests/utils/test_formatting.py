@@ -0,0 +1,9 @@
+"""Tests for formatting utilities."""
+
+from crs_thoughts.utils.formatting import escape_content
+
+def test_escape_content():
+    """Test newlines are flattened and quotes doubled in one pass."""
+    content = 'line one\nline "two"\r\nend'
+    
+    assert escape_content(content) == 'line one line ""two""  end'
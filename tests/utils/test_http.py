@@ -0,0 +1,19 @@
+"""Tests for pooled HTTP client sessions."""
+
+import pytest
+
+from crs_thoughts.utils.http import close_shared_session, get_session
+
+@pytest.mark.asyncio
+async def test_pools_are_shared_per_name_and_closed_together():
+    """Test each pool name keeps one session and one call closes them all."""
+    try:
+        ollama = await get_session('ollama', limit_per_host=16)
+        searxng = await get_session('searxng', limit_per_host=8)
+        
+        assert await get_session('ollama') is ollama
+        assert searxng is not ollama
+        assert ollama.connector.limit_per_host == 16
+    finally:
+        await close_shared_session()
+    assert ollama.closed and searxng.closed
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""Tests for structured logging helpers."""
+
+import uuid
+
+from crs_thoughts.utils.log import stringify_uuids
+
+def test_stringify_uuids():
+    """Test UUID values are rendered as strings and others left alone."""
+    entry_uuid = uuid.uuid4()
+    event = {'event': 'handling_thought', 'entry_uuid': entry_uuid,
+             'session_uuid': None, 'tags': ['python']}
+    
+    result = stringify_uuids(None, 'info', event)
+    
+    assert result['entry_uuid'] == str(entry_uuid)
+    assert result['session_uuid'] is None
+    assert result['tags'] == ['python']